@@ -11,70 +11,93 @@ bl_info = {
 }
 
 import bpy
-from bpy.props import BoolProperty, IntProperty, StringProperty
+from bpy.props import BoolProperty, IntProperty, StringProperty, PointerProperty
 
 # Import all operators and panels
 from .operators.setup import MultiChannelExportPipelineSetup
 from .panels.export_panel import MultiChannelExportPanel
 
-# Import render operators directly 
+# Import render operators directly
 from .operators.render import (
     RenderAllOperator,
     RenderMobileOnlyOperator,
     RenderDesktopOnlyOperator,
     AdvancedRenderSettingsOperator,
-    SwitchToSceneOperator
+    SwitchToSceneOperator,
+    clear_path_cache
 )
 
 # Define addon version as string for display
 __version__ = ".".join(str(v) for v in bl_info["version"])
 
-# Registration
-classes = (
-    MultiChannelExportPipelineSetup,
-    RenderAllOperator,
-    RenderMobileOnlyOperator,
-    RenderDesktopOnlyOperator,
-    AdvancedRenderSettingsOperator,
-    SwitchToSceneOperator,
-    MultiChannelExportPanel,
-)
-
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-    
-    # Add custom properties to store loop settings
-    bpy.types.Scene.loop_extend_frames = BoolProperty(
+class MCESettings(bpy.types.PropertyGroup):
+    """Scene-level pipeline settings, grouped into a single RNA slot"""
+    loop_extend_frames: BoolProperty(
         name="Create Loop Animation",
         description="Create a loop by playing forwards, holding last frame, playing backwards, and holding first frame",
         default=False
     )
-    
-    bpy.types.Scene.hold_frames = IntProperty(
+
+    hold_frames: IntProperty(
         name="Hold Frames",
         description="Number of frames to hold at the end and beginning for looping",
         default=15,
         min=1,
         max=120
     )
-    
-    # Store version for UI display
-    bpy.types.Scene.mce_addon_version = StringProperty(
+
+    frame_staging_dir: StringProperty(
+        name="Frame Staging Directory",
+        description="Optional fast scratch directory for intermediate frames "
+                    "(e.g. /dev/shm on Linux or a RAM disk); leave empty to "
+                    "keep frames under //Output/",
+        default="",
+        subtype='DIR_PATH'
+    )
+
+    addon_version: StringProperty(
         name="Addon Version",
         description="Current version of the Multi-Channel Export Pipeline addon",
         default=__version__,
         options={'HIDDEN'}
     )
 
+# Registration
+classes = (
+    MCESettings,
+    MultiChannelExportPipelineSetup,
+    RenderAllOperator,
+    RenderMobileOnlyOperator,
+    RenderDesktopOnlyOperator,
+    AdvancedRenderSettingsOperator,
+    SwitchToSceneOperator,
+    MultiChannelExportPanel,
+)
+
+# Single C-side registration call instead of a Python loop per class
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
+def register():
+    _register_classes()
+
+    # One pointer to the settings group instead of three Scene attributes
+    bpy.types.Scene.mce = PointerProperty(type=MCESettings)
+
+    # Invalidate cached output paths whenever the file is saved or another
+    # file is loaded; both can change the blend file location
+    bpy.app.handlers.save_post.append(clear_path_cache)
+    bpy.app.handlers.load_post.append(clear_path_cache)
+
 def unregister():
+    if clear_path_cache in bpy.app.handlers.save_post:
+        bpy.app.handlers.save_post.remove(clear_path_cache)
+    if clear_path_cache in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(clear_path_cache)
+
     # Remove custom properties
-    del bpy.types.Scene.loop_extend_frames
-    del bpy.types.Scene.hold_frames
-    del bpy.types.Scene.mce_addon_version
-    
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    del bpy.types.Scene.mce
+
+    _unregister_classes()
 
 if __name__ == "__main__":
     register()
\ No newline at end of file
@@ -1,724 +1,1122 @@
 import bpy
 import os
-import sys
-import glob
-import re
-import subprocess
-import shutil
-import tempfile
+import functools
+import logging
+from collections import namedtuple
+
+# sys/subprocess/shutil/tempfile are imported lazily inside the
+# functions that need them so addon registration doesn't pay for them
 from bpy.props import StringProperty, IntProperty, FloatProperty, EnumProperty, BoolProperty
+from bpy.app.handlers import persistent
 from bpy.types import Operator
 
-class RenderAllOperator(Operator):
-    """Render all scenes and composites in sequence"""
-    bl_idname = "export.render_all"
-    bl_label = "Render All Scenes"
-    bl_options = {'REGISTER'}
-    
-    def execute(self, context):
-        # Enhanced debugging
-        self.report({'INFO'}, f"🏁 Starting multi-channel export render process")
-        self.report({'INFO'}, f"📄 Current Blender version: {bpy.app.version_string}")
-        
-        # Get the current blend file name and path
-        blend_filepath = bpy.data.filepath
-        if not blend_filepath:
-            self.report({'ERROR'}, "❌ Please save your file first")
-            return {'CANCELLED'}
-        
-        blend_dir = os.path.dirname(blend_filepath)
-        blend_filename = os.path.splitext(os.path.basename(blend_filepath))[0]
-        self.report({'INFO'}, f"📄 Blend file: {blend_filepath}")
-        self.report({'INFO'}, f"📁 Working directory: {blend_dir}")
-        
-        # Render frames first, then render videos
-        frame_scenes = [
-            "MobileScene",
-            "DesktopScene"
+# Per-frame progress goes through this logger so it is a no-op unless a
+# user turns on debug logging; milestone lines still reach the info bar
+_logger = logging.getLogger("RenderRoute")
+
+_ResolvedPaths = namedtuple("_ResolvedPaths", ["blend_filename", "mobile_frames_abs", "desktop_frames_abs"])
+
+PipelineTarget = namedtuple("PipelineTarget", ["label", "scene_name", "frames_dir", "out_dir"])
+
+# Base output directory, relative to the blend file
+_OUTPUT_DIR = "//Output/"
+
+# Extensions the render step can produce; discovery filters on these so a
+# stray .log or .blend1 beside the frames never reaches the encode
+_IMAGE_EXTS = {'.png', '.jpg', '.jpeg', '.exr', '.tif', '.tiff'}
+
+# (crf, preset) per quality level. With tune=animation doing the heavy
+# lifting for CG content, the presets can run a notch faster at the same
+# perceptual quality.
+_QUALITY_PRESETS = {
+    "high": ("18", "medium"),
+    "medium": ("23", "fast"),
+    "low": ("28", "veryfast"),
+}
+
+# Single source of truth for the per-channel scene names and directories,
+# built once at import so operators never concatenate paths at run time
+PIPELINE_TARGETS = {
+    "mobile": PipelineTarget("Mobile", "MobileScene",
+                             _OUTPUT_DIR + "MobileFrames/", _OUTPUT_DIR + "MobileOut/"),
+    "desktop": PipelineTarget("Desktop", "DesktopScene",
+                              _OUTPUT_DIR + "DesktopFrames/", _OUTPUT_DIR + "DesktopOut/"),
+}
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_paths(blend_filepath):
+    """Resolve the per-blend-file name and frame directories once and memoize"""
+    blend_filename = os.path.splitext(os.path.basename(blend_filepath))[0]
+    return _ResolvedPaths(
+        blend_filename,
+        bpy.path.abspath(PIPELINE_TARGETS["mobile"].frames_dir),
+        bpy.path.abspath(PIPELINE_TARGETS["desktop"].frames_dir)
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _abspath(path):
+    """Memoized bpy.path.abspath for the handful of pipeline directories.
+
+    Resolving a //-relative path rebuilds a string from the blend file
+    location every call; the frame and output directories are asked for
+    several times per run, so resolve each once per session.
+    """
+    return bpy.path.abspath(path)
+
+
+def _encode_signature(frames_dir, prefix, loop, hold_frames, quality, fps, crf):
+    """Signature of everything that affects an encode's output.
+
+    Lets repeated runs with identical frames and parameters skip the whole
+    FFmpeg pass instead of re-encoding an identical video.
+    """
+    abs_dir = _abspath(frames_dir)
+    count = 0
+    newest = 0.0
+    if os.path.isdir(abs_dir):
+        needle = prefix + "_"
+        with os.scandir(abs_dir) as it:
+            for entry in it:
+                if entry.name.startswith(needle):
+                    count += 1
+                    mtime = entry.stat().st_mtime
+                    if mtime > newest:
+                        newest = mtime
+    return f"{count}:{newest}:{loop}:{hold_frames}:{quality}:{fps}:{crf}"
+
+
+def _frames_dir_for(target, settings):
+    """Resolve a channel's frames directory, honoring the staging override.
+
+    Pointing frame_staging_dir at a tmpfs mount keeps the intermediate
+    frames in RAM; only the final video then touches disk.
+    """
+    staging = settings.frame_staging_dir
+    if staging:
+        return os.path.join(staging, os.path.basename(target.frames_dir.rstrip("/"))) + os.sep
+    return target.frames_dir
+
+
+# Directories already created this session; lets repeat runs skip the
+# ancestor stat-walk os.makedirs performs on every call
+_EXISTING_DIRS = set()
+
+
+def _ensure_dir(abs_dir):
+    """os.makedirs(exist_ok=True) behind a session-level known-exists cache"""
+    if abs_dir not in _EXISTING_DIRS:
+        os.makedirs(abs_dir, exist_ok=True)
+        _EXISTING_DIRS.add(abs_dir)
+
+
+def _forget_dir(abs_dir):
+    """Evict a deleted directory (and everything under it) from the cache.
+
+    Anything that removes a directory _ensure_dir may have seen must call
+    this, or a later _ensure_dir on the same path becomes a no-op against
+    a path that no longer exists.
+    """
+    root = abs_dir.rstrip(os.sep)
+    _EXISTING_DIRS.difference_update(
+        {d for d in _EXISTING_DIRS
+         if d.rstrip(os.sep) == root or d.startswith(root + os.sep)})
+
+
+@persistent
+def clear_path_cache(*args):
+    """Drop memoized paths when the file is saved (possibly under a new name)"""
+    _resolve_paths.cache_clear()
+    _abspath.cache_clear()
+    _EXISTING_DIRS.clear()
+
+
+def _any_matching(dirpath, prefix):
+    """Cheap existence test for rendered frames, short-circuiting on first hit"""
+    abs_dir = _abspath(dirpath)
+    if not os.path.isdir(abs_dir):
+        return False
+    needle = prefix + "_"
+    with os.scandir(abs_dir) as it:
+        return any(entry.name.startswith(needle) for entry in it)
+
+
+def _count_matching(dirpath, prefix):
+    """Count rendered frames without materializing a path list"""
+    abs_dir = _abspath(dirpath)
+    if not os.path.isdir(abs_dir):
+        return 0
+    needle = prefix + "_"
+    with os.scandir(abs_dir) as it:
+        return sum(1 for entry in it if entry.name.startswith(needle))
+
+
+# Prelude injected into workers so each one enables a single Cycles compute
+# device; concurrent renders then spread across GPUs instead of fighting
+# over the first one. Falls back silently when there are fewer GPUs.
+_DEVICE_PRELUDE = (
+    "import bpy\n"
+    "addon = bpy.context.preferences.addons.get('cycles')\n"
+    "if addon is not None:\n"
+    "    cprefs = addon.preferences\n"
+    "    cprefs.refresh_devices()\n"
+    "    gpus = [d for d in cprefs.devices if d.type != 'CPU']\n"
+    "    if len(gpus) > {dev}:\n"
+    "        for i, d in enumerate(gpus):\n"
+    "            d.use = (i == {dev})\n"
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _nvenc_usable(ffmpeg_command):
+    """True when the host renders on CUDA and this FFmpeg ships h264_nvenc.
+
+    Cached per FFmpeg binary: the encoder list and device configuration
+    don't change within a session, and probing spawns a subprocess.
+    """
+    import subprocess
+
+    addon = bpy.context.preferences.addons.get('cycles')
+    if addon is None:
+        return False
+    if not any(d.type == 'CUDA' and d.use for d in addon.preferences.devices):
+        return False
+    try:
+        result = subprocess.run([ffmpeg_command, '-hide_banner', '-encoders'],
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE,
+                                text=True,
+                                check=False)
+    except OSError:
+        return False
+    return result.returncode == 0 and 'h264_nvenc' in result.stdout
+
+
+def _spawn_render(scene_name, blendfile, device_index=None,
+                  frame_start=None, frame_end=None):
+    """Launch a headless Blender process rendering one scene's animation.
+
+    An explicit frame range renders just that segment; segments of the
+    same scene write into the same output directory with their real
+    frame numbers, so no reassembly is needed afterwards.
+
+    Returns ``(proc, stderr_file)``. Workers print a progress line per
+    frame, and nothing drains their pipes while they run, so a PIPE
+    would fill and block the worker — the same failure mode the encodes
+    avoid with -loglevel error. stdout is dropped and stderr lands in an
+    unlinked temp file the reaper reads only on failure.
+    """
+    import subprocess
+    import tempfile
+
+    cmd = [bpy.app.binary_path, "-b", blendfile]
+    if device_index is not None:
+        cmd += ["--python-expr", _DEVICE_PRELUDE.format(dev=device_index)]
+    cmd += ["-S", scene_name]
+    if frame_start is not None:
+        cmd += ["-s", str(frame_start), "-e", str(frame_end)]
+    cmd += ["-a"]
+    stderr_file = tempfile.TemporaryFile()
+    proc = subprocess.Popen(cmd,
+                            stdout=subprocess.DEVNULL,
+                            stderr=stderr_file)
+    return proc, stderr_file
+
+
+def _frame_stem(name):
+    """The numeric frame substring of a name like "prefix_0001.ext", or None.
+
+    Plain suffix slicing instead of a regex: the pattern is fixed and this
+    runs once per frame on multi-thousand-frame renders.
+    """
+    tail = name.rpartition('.')[0].rpartition('_')[2]
+    return tail if tail.isdigit() else None
+
+
+def _print_report(level, message):
+    """Fallback report target when no operator is driving the pipeline"""
+    print(message)
+
+
+def _flush(report, log):
+    """Emit buffered INFO lines as one report.
+
+    Each report() call marshals a report struct and redraws the status
+    bar, so the pipeline collects its progress lines here instead of
+    reporting them one by one.
+    """
+    if log:
+        report({'INFO'}, "\n".join(log))
+        log.clear()
+
+
+# Verified FFmpeg path from the first successful probe. The binary does
+# not move within a session, and probing spawns an `ffmpeg -version`
+# subprocess, so every encode after the first reuses this.
+_FFMPEG_PATH = None
+
+
+def _find_ffmpeg(report, log):
+    """Locate a working FFmpeg binary once per session; returns path or None.
+
+    Failures are not cached, so installing FFmpeg mid-session is picked
+    up on the next attempt.
+    """
+    global _FFMPEG_PATH
+    if _FFMPEG_PATH is None:
+        _FFMPEG_PATH = _probe_ffmpeg(report, log)
+    return _FFMPEG_PATH
+
+
+def _probe_ffmpeg(report, log):
+    """Search the usual locations and verify the binary actually runs"""
+    import subprocess
+    import sys
+
+    try:
+        log.append("🔍 Checking for FFmpeg installation...")
+
+        # One C-level PATH walk covers the common case with a single stat
+        # per PATH entry; the per-platform lists below remain for GUI
+        # launches that don't inherit a shell PATH
+        import shutil
+        which_path = shutil.which('ffmpeg')
+        if which_path:
+            result = subprocess.run([which_path, '-version'],
+                                    stdout=subprocess.PIPE,
+                                    stderr=subprocess.PIPE,
+                                    text=True,
+                                    check=False)
+            if result.returncode == 0:
+                version_line = result.stdout.split('\n')[0]
+                log.append(f"✅ FFmpeg found at {which_path}: {version_line}")
+                return which_path
+
+        # List of common FFmpeg locations on macOS
+        mac_ffmpeg_paths = [
+            '/usr/local/bin/ffmpeg',                    # Homebrew (Intel)
+            '/opt/homebrew/bin/ffmpeg',                 # Homebrew (Apple Silicon)
+            '/usr/bin/ffmpeg',                          # System
+            '/Applications/FFmpeg/bin/ffmpeg',          # Manual install
+            os.path.expanduser('~/bin/ffmpeg'),         # User bin
+            os.path.expanduser('~/.local/bin/ffmpeg')   # User local
         ]
         
-        # Store original scene
-        original_scene = context.window.scene.name
-        self.report({'INFO'}, f"🔄 Original scene: {original_scene}")
+        # List of common FFmpeg locations on Windows
+        windows_ffmpeg_paths = [
+            'C:\\Program Files\\FFmpeg\\bin\\ffmpeg.exe',
+            'C:\\FFmpeg\\bin\\ffmpeg.exe'
+        ]
         
-        # First render all the frame scenes
-        self.report({'INFO'}, "🎬 --- Rendering Frames ---")
-        for scene_name in frame_scenes:
-            if scene_name in bpy.data.scenes:
-                scene = bpy.data.scenes[scene_name]
-                self.report({'INFO'}, f"🎬 Preparing to render {scene_name}")
-                self.report({'INFO'}, f"🔄 Output path: {scene.render.filepath}")
-                self.report({'INFO'}, f"🔄 Absolute output path: {bpy.path.abspath(scene.render.filepath)}")
-                self.report({'INFO'}, f"🔄 Format: {scene.render.image_settings.file_format}")
-                
-                # Check if output directory exists
-                output_dir = os.path.dirname(bpy.path.abspath(scene.render.filepath))
-                if not os.path.exists(output_dir):
-                    self.report({'WARNING'}, f"⚠️ Output directory doesn't exist, creating: {output_dir}")
-                    os.makedirs(output_dir, exist_ok=True)
-                
-                # Switch to the scene
-                context.window.scene = bpy.data.scenes[scene_name]
-                self.report({'INFO'}, f"🔄 Switched to scene: {context.window.scene.name}")
-                
-                # Force screen update
-                bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
-                
-                # Render animation for this scene
-                self.report({'INFO'}, f"🎬 Starting render for {scene_name}...")
-                bpy.ops.render.render(animation=True)
-                
-                self.report({'INFO'}, f"✅ Finished rendering {scene_name}")
-            else:
-                self.report({'WARNING'}, f"⚠️ Scene {scene_name} not found!")
-        
-        # Use the default output path if not specified
-        output_dir = "//Output/"
-        self.report({'INFO'}, f"📁 Using output directory: {output_dir}")
-        self.report({'INFO'}, f"📁 Absolute output path: {bpy.path.abspath(output_dir)}")
-        
-        # Check if frames exist
-        mobile_frames_dir = output_dir + "MobileFrames/"
-        desktop_frames_dir = output_dir + "DesktopFrames/"
-        
-        # Get looping settings from control scene
-        control_scene = bpy.data.scenes.get("ControlScene", context.scene)
-        if not control_scene:
-            self.report({'WARNING'}, "⚠️ ControlScene not found, using current scene")
-            control_scene = context.scene
-        
-        # Safe attribute access
-        loop_extend_frames = getattr(control_scene, "loop_extend_frames", False)
-        hold_frames = getattr(control_scene, "hold_frames", 15)
-        self.report({'INFO'}, f"🔄 Loop settings: loop={loop_extend_frames}, hold_frames={hold_frames}")
-        
-        # Use the source scene's FPS
-        mobile_scene = bpy.data.scenes.get("MobileScene")
-        desktop_scene = bpy.data.scenes.get("DesktopScene")
-        
-        mobile_fps = mobile_scene.render.fps if mobile_scene else 30
-        desktop_fps = desktop_scene.render.fps if desktop_scene else 30
-        self.report({'INFO'}, f"🔄 FPS settings: mobile={mobile_fps}, desktop={desktop_fps}")
-        
-        # Generate videos using FFmpeg
-        self.report({'INFO'}, "🎞️ --- Generating Videos with FFmpeg ---")
-        
-        # Mobile video
-        self.report({'INFO'}, "🎞️ Creating mobile video...")
-        success_mobile = self.create_video_with_ffmpeg(
-            frames_dir=mobile_frames_dir,
-            output_file=output_dir + "MobileOut/" + blend_filename + ".mp4",
-            blend_filename=blend_filename,
-            fps=mobile_fps,
-            loop=loop_extend_frames,
-            hold_frames=hold_frames
-        )
-        
-        # Desktop video
-        self.report({'INFO'}, "🎞️ Creating desktop video...")
-        success_desktop = self.create_video_with_ffmpeg(
-            frames_dir=desktop_frames_dir,
-            output_file=output_dir + "DesktopOut/" + blend_filename + ".mp4",
-            blend_filename=blend_filename,
-            fps=desktop_fps,
-            loop=loop_extend_frames,
-            hold_frames=hold_frames
-        )
-        
-        # Return to original scene
-        context.window.scene = bpy.data.scenes[original_scene]
-        self.report({'INFO'}, f"🔄 Returned to original scene: {original_scene}")
-        
-        if success_mobile or success_desktop:
-            self.report({'INFO'}, "✅ All rendering complete!")
-            return {'FINISHED'}
-        else:
-            self.report({'ERROR'}, "❌ No frames were found to render!")
-            return {'CANCELLED'}
-    
-    def check_ffmpeg(self):
-        """Check if FFmpeg is installed and available with enhanced path detection"""
-        try:
-            self.report({'INFO'}, "🔍 Checking for FFmpeg installation...")
-            
-            # List of common FFmpeg locations on macOS
-            mac_ffmpeg_paths = [
-                '/usr/local/bin/ffmpeg',                    # Homebrew (Intel)
-                '/opt/homebrew/bin/ffmpeg',                 # Homebrew (Apple Silicon)
-                '/usr/bin/ffmpeg',                          # System
-                '/Applications/FFmpeg/bin/ffmpeg',          # Manual install
-                os.path.expanduser('~/bin/ffmpeg'),         # User bin
-                os.path.expanduser('~/.local/bin/ffmpeg')   # User local
-            ]
-            
-            # List of common FFmpeg locations on Windows
-            windows_ffmpeg_paths = [
-                'C:\\Program Files\\FFmpeg\\bin\\ffmpeg.exe',
-                'C:\\FFmpeg\\bin\\ffmpeg.exe'
-            ]
-            
-            # Try with direct paths first
-            ffmpeg_paths = []
-            if sys.platform == 'darwin':  # macOS
-                ffmpeg_paths = mac_ffmpeg_paths
-            elif sys.platform == 'win32':  # Windows
-                ffmpeg_paths = windows_ffmpeg_paths
-            
-            # Check each path
-            for path in ffmpeg_paths:
-                if os.path.exists(path):
-                    self.report({'INFO'}, f"🔍 Found FFmpeg at: {path}")
-                    result = subprocess.run([path, '-version'],
-                                         stdout=subprocess.PIPE,
-                                         stderr=subprocess.PIPE,
-                                         text=True,
-                                         check=False)
-                    
-                    if result.returncode == 0:
-                        version_line = result.stdout.split('\n')[0]
-                        self.report({'INFO'}, f"✅ FFmpeg found at {path}: {version_line}")
-                        
-                        # Store the path for future use
-                        self.ffmpeg_path = path
-                        return True
-            
-            # If we get here, try using PATH
-            self.report({'INFO'}, "🔍 Checking for FFmpeg in PATH...")
-            
-            # Get the current PATH environment variable and print it for debugging
-            current_path = os.environ.get('PATH', '')
-            self.report({'INFO'}, f"🔍 Current PATH: {current_path}")
-            
-            # Try to run ffmpeg using the PATH
-            try:
-                result = subprocess.run(['ffmpeg', '-version'],
-                                      stdout=subprocess.PIPE,
-                                      stderr=subprocess.PIPE,
-                                      text=True,
-                                      check=False)
+        # Try with direct paths first
+        ffmpeg_paths = []
+        if sys.platform == 'darwin':  # macOS
+            ffmpeg_paths = mac_ffmpeg_paths
+        elif sys.platform == 'win32':  # Windows
+            ffmpeg_paths = windows_ffmpeg_paths
+        
+        # Check each path
+        for path in ffmpeg_paths:
+            if os.path.exists(path):
+                log.append(f"🔍 Found FFmpeg at: {path}")
+                result = subprocess.run([path, '-version'],
+                                     stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE,
+                                     text=True,
+                                     check=False)
                 
                 if result.returncode == 0:
                     version_line = result.stdout.split('\n')[0]
-                    self.report({'INFO'}, f"✅ FFmpeg found in PATH: {version_line}")
-                    self.ffmpeg_path = 'ffmpeg'  # Use command name since it's in PATH
-                    return True
-                else:
-                    self.report({'ERROR'}, f"❌ FFmpeg check failed with error: {result.stderr}")
-            except FileNotFoundError:
-                self.report({'ERROR'}, "❌ FFmpeg not found in PATH")
-            
-            # As a last resort, try to find ffmpeg using the 'which' command on macOS/Linux
-            if sys.platform != 'win32':
-                try:
-                    result = subprocess.run(['which', 'ffmpeg'],
-                                          stdout=subprocess.PIPE,
-                                          stderr=subprocess.PIPE,
-                                          text=True,
-                                          check=False)
+                    log.append(f"✅ FFmpeg found at {path}: {version_line}")
                     
-                    if result.returncode == 0 and result.stdout.strip():
-                        ffmpeg_path = result.stdout.strip()
-                        self.report({'INFO'}, f"🔍 Found FFmpeg via 'which' at: {ffmpeg_path}")
-                        
-                        # Verify it works
-                        verify = subprocess.run([ffmpeg_path, '-version'],
-                                              stdout=subprocess.PIPE,
-                                              stderr=subprocess.PIPE,
-                                              text=True,
-                                              check=False)
-                        
-                        if verify.returncode == 0:
-                            version_line = verify.stdout.split('\n')[0]
-                            self.report({'INFO'}, f"✅ FFmpeg verified at {ffmpeg_path}: {version_line}")
-                            self.ffmpeg_path = ffmpeg_path
-                            return True
-                except Exception as e:
-                    self.report({'ERROR'}, f"❌ Error checking for FFmpeg with 'which': {str(e)}")
-            
-            # We've exhausted all options
-            self.report({'ERROR'}, "❌ FFmpeg not found. Please install FFmpeg or update the PATH.")
-            self.report({'ERROR'}, "ℹ️ You might need to restart Blender after installing FFmpeg.")
-            
-            # Offer guidance based on platform
-            if sys.platform == 'darwin':
-                self.report({'ERROR'}, "ℹ️ On macOS, you can install FFmpeg with: brew install ffmpeg")
-            elif sys.platform == 'win32':
-                self.report({'ERROR'}, "ℹ️ On Windows, download FFmpeg from https://ffmpeg.org/download.html")
-            else:
-                self.report({'ERROR'}, "ℹ️ On Linux, use: sudo apt install ffmpeg or equivalent")
-            
-            return False
-        except Exception as e:
-            self.report({'ERROR'}, f"❌ Error checking FFmpeg: {str(e)}")
-            return False
-    
-    def convert_exr_to_png(self, frames_dir, blend_filename):
-        """Convert EXR files to PNG with proper color management for better video encoding"""
-        self.report({'INFO'}, f"🎨 Converting EXR files to PNG for proper color management")
-        
-        # Find EXR frames
-        exr_frames = self.find_frames(frames_dir, blend_filename)
-        if not exr_frames:
-            self.report({'WARNING'}, f"⚠️ No EXR frames found to convert")
-            return []
-        
-        # Create a temporary directory for PNG frames
-        png_dir = os.path.join(bpy.path.abspath(frames_dir), "png_temp")
-        os.makedirs(png_dir, exist_ok=True)
-        self.report({'INFO'}, f"📁 Created PNG conversion directory: {png_dir}")
+                    return path
         
-        # Create a temporary Blender scene for EXR to PNG conversion with proper color management
-        temp_scene = bpy.data.scenes.new("__temp_convert_scene")
+        # If we get here, try using PATH
+        log.append("🔍 Checking for FFmpeg in PATH...")
         
-        # Set up proper color management
-        temp_scene.view_settings.view_transform = 'Filmic'  # or 'Standard' depending on your preference
-        temp_scene.view_settings.look = 'None'
-        temp_scene.display_settings.display_device = 'sRGB'
-        
-        # Set up rendering settings
-        temp_scene.render.image_settings.file_format = 'PNG'
-        temp_scene.render.image_settings.color_mode = 'RGBA'
-        temp_scene.render.image_settings.color_depth = '8'
-        
-        png_frames = []
+        # Get the current PATH environment variable and print it for debugging
+        current_path = os.environ.get('PATH', '')
+        log.append(f"🔍 Current PATH: {current_path}")
         
+        # Try to run ffmpeg using the PATH
         try:
-            # Process each EXR frame
-            for i, exr_path in enumerate(exr_frames):
-                if i % 10 == 0 or i == len(exr_frames) - 1:  # Log progress every 10 frames and the last frame
-                    self.report({'INFO'}, f"🔄 Converting frame {i+1}/{len(exr_frames)}")
-                
-                # Get frame number from filename
-                basename = os.path.basename(exr_path)
-                match = re.search(r'_(\d+)\.', basename)
-                if not match:
-                    self.report({'WARNING'}, f"⚠️ Could not extract frame number from {basename}")
-                    continue
-                    
-                frame_num = match.group(1)
-                
-                # Create output PNG path
-                png_path = os.path.join(png_dir, f"{blend_filename}_{frame_num}.png")
-                
-                # Skip if PNG already exists
-                if os.path.exists(png_path):
-                    self.report({'INFO'}, f"✅ PNG already exists: {png_path}")
-                    png_frames.append(png_path)
-                    continue
-                
-                # Load the EXR image
-                img_name = f"temp_convert_{i}"
-                if img_name in bpy.data.images:
-                    bpy.data.images.remove(bpy.data.images[img_name])
-                
-                try:
-                    img = bpy.data.images.load(exr_path)
-                    img.name = img_name
-                except Exception as e:
-                    self.report({'ERROR'}, f"❌ Error loading EXR {exr_path}: {str(e)}")
-                    continue
-                
-                # Set color space explicitly
-                img.colorspace_settings.name = 'Linear'
-                
-                # Save as PNG with color management applied
-                img.filepath_raw = png_path
-                img.file_format = 'PNG'
-                
-                try:
-                    img.save_render(png_path, scene=temp_scene)
-                    self.report({'INFO'}, f"✅ Saved PNG: {png_path}")
-                except Exception as e:
-                    self.report({'ERROR'}, f"❌ Error saving PNG {png_path}: {str(e)}")
-                    continue
-                
-                # Add to list of PNG frames
-                png_frames.append(png_path)
-                
-                # Clean up
-                bpy.data.images.remove(img)
-        
-        except Exception as e:
-            self.report({'ERROR'}, f"❌ Error during EXR to PNG conversion: {str(e)}")
-        
-        finally:
-            # Clean up the temporary scene
-            bpy.data.scenes.remove(temp_scene)
-        
-        self.report({'INFO'}, f"✅ Converted {len(png_frames)}/{len(exr_frames)} EXR frames to PNG")
-        return png_frames
-    
-    def find_frames(self, frames_dir, blend_filename):
-        """Find all frames in the directory and return sorted list"""
-        # Make sure we're using the right path format for Blender
-        abs_frames_dir = bpy.path.abspath(frames_dir)
-        
-        self.report({'INFO'}, f"🔍 Looking for frames in directory: {abs_frames_dir}")
-        
-        # Check if directory exists
-        if not os.path.exists(abs_frames_dir):
-            self.report({'ERROR'}, f"❌ Frames directory does not exist: {abs_frames_dir}")
-            return []
-        
-        # List all files in the directory for debugging
-        try:
-            existing_files = os.listdir(abs_frames_dir)
-            self.report({'INFO'}, f"📁 Directory contains {len(existing_files)} files")
-            if existing_files:
-                self.report({'INFO'}, f"📁 First few files: {existing_files[:5]}")
-        except Exception as e:
-            self.report({'ERROR'}, f"❌ Error listing directory contents: {str(e)}")
-        
-        # Look for files matching pattern like "filename_####.ext"
-        patterns = [
-            os.path.join(abs_frames_dir, f"{blend_filename}_*.png"),
-            os.path.join(abs_frames_dir, f"{blend_filename}_*.jpg"),
-            os.path.join(abs_frames_dir, f"{blend_filename}_*.jpeg"),
-            os.path.join(abs_frames_dir, f"{blend_filename}_*.exr"),
-            os.path.join(abs_frames_dir, f"{blend_filename}_*.tif"),
-            os.path.join(abs_frames_dir, f"{blend_filename}_*.tiff")
-        ]
-        
-        all_frames = []
-        for pattern in patterns:
-            self.report({'INFO'}, f"🔍 Looking for frames with pattern: {pattern}")
-            frames = glob.glob(pattern)
-            self.report({'INFO'}, f"🔍 Found {len(frames)} frames with pattern {os.path.basename(pattern)}")
-            all_frames.extend(frames)
-        
-        if not all_frames:
-            self.report({'WARNING'}, f"⚠️ No frames found matching filename pattern '{blend_filename}_*' in {abs_frames_dir}")
-            return []
-        
-        # Sort frames to ensure correct order
-        # We need to sort numerically by the frame number
-        def get_frame_number(filepath):
-            # Extract frame number from filename like "name_001.ext"
-            basename = os.path.basename(filepath)
-            match = re.search(r'_(\d+)\.', basename)
-            if match:
-                return int(match.group(1))
-            return 0
-        
-        all_frames.sort(key=get_frame_number)
-        
-        # Log some frames for debugging
-        if len(all_frames) > 0:
-            self.report({'INFO'}, f"✅ Found {len(all_frames)} frames in total")
-            self.report({'INFO'}, f"📄 First frame: {os.path.basename(all_frames[0])}")
-            if len(all_frames) > 1:
-                self.report({'INFO'}, f"📄 Second frame: {os.path.basename(all_frames[1])}")
-            self.report({'INFO'}, f"📄 Last frame: {os.path.basename(all_frames[-1])}")
-        
-        return all_frames
-    
-    def prepare_frames_for_ffmpeg(self, frames, temp_dir, loop=False, hold_frames=15):
-        """Copy and organize frames for FFmpeg to process including loops and holds"""
-        frame_count = len(frames)
-        if frame_count == 0:
-            self.report({'ERROR'}, "❌ No frames to prepare for FFmpeg")
-            return 0
+            result = subprocess.run(['ffmpeg', '-version'],
+                                  stdout=subprocess.PIPE,
+                                  stderr=subprocess.PIPE,
+                                  text=True,
+                                  check=False)
             
-        self.report({'INFO'}, f"🔄 Preparing {frame_count} frames in {temp_dir}")
-        
-        # Get file extension from the first frame
-        _, ext = os.path.splitext(frames[0])
-        
-        # For simple forward animation (no loop)
-        if not loop or frame_count <= 1:
-            self.report({'INFO'}, "🔄 Creating simple forward animation (no loop)")
-            # Copy all frames with sequential numbering for ffmpeg
-            for i, frame_path in enumerate(frames):
-                new_name = f"frame_{i+1:04d}{ext}"
-                new_path = os.path.join(temp_dir, new_name)
-                shutil.copy2(frame_path, new_path)
-                if i % 10 == 0 or i == frame_count - 1:  # Report progress every 10 frames and the last frame
-                    self.report({'INFO'}, f"🔄 Copied frame {i+1}/{frame_count}")
-            return frame_count
-        
-        # For loop animation (forward + hold + reverse + hold)
-        self.report({'INFO'}, f"🔄 Creating loop animation (forward + hold + reverse + hold)")
-        total_frames = 0
-        
-        # 1. Forward animation
-        self.report({'INFO'}, f"🔄 Adding forward animation ({len(frames)} frames)")
-        for i, frame_path in enumerate(frames):
-            new_name = f"frame_{total_frames+1:04d}{ext}"
-            shutil.copy2(frame_path, os.path.join(temp_dir, new_name))
-            total_frames += 1
-        
-        # 2. Hold last frame
-        last_frame = frames[-1]
-        self.report({'INFO'}, f"🔄 Adding hold on last frame ({hold_frames} frames)")
-        for i in range(hold_frames):
-            new_name = f"frame_{total_frames+1:04d}{ext}"
-            shutil.copy2(last_frame, os.path.join(temp_dir, new_name))
-            total_frames += 1
-        
-        # 3. Reverse animation
-        self.report({'INFO'}, f"🔄 Adding reverse animation ({len(frames)} frames)")
-        for frame_path in reversed(frames):
-            new_name = f"frame_{total_frames+1:04d}{ext}"
-            shutil.copy2(frame_path, os.path.join(temp_dir, new_name))
-            total_frames += 1
-        
-        # 4. Hold first frame
-        first_frame = frames[0]
-        self.report({'INFO'}, f"🔄 Adding hold on first frame ({hold_frames} frames)")
-        for i in range(hold_frames):
-            new_name = f"frame_{total_frames+1:04d}{ext}"
-            shutil.copy2(first_frame, os.path.join(temp_dir, new_name))
-            total_frames += 1
-        
-        self.report({'INFO'}, f"✅ Prepared total of {total_frames} frames for FFmpeg")
-        return total_frames
-    
-    def create_video_with_ffmpeg(self, frames_dir, output_file, blend_filename, fps=30, 
-                               loop=False, hold_frames=15, quality="high", crf=23):
-        """Use FFmpeg to create video from frames with proper color management"""
-        # Check if FFmpeg is available
-        if not self.check_ffmpeg():
-            self.report({'ERROR'}, "❌ FFmpeg is required but not found. Please install FFmpeg.")
-            return False
-        
-        # Use the stored ffmpeg path
-        ffmpeg_command = getattr(self, 'ffmpeg_path', 'ffmpeg')
-        
-        # Find original frames to check format
-        self.report({'INFO'}, f"🔍 Checking frames in {frames_dir}")
-        original_frames = self.find_frames(frames_dir, blend_filename)
-        
-        if not original_frames:
-            self.report({'WARNING'}, f"⚠️ No frames found in {frames_dir}")
-            return False
-        
-        # Check if we have EXR files that need conversion
-        _, ext = os.path.splitext(original_frames[0])
-        is_exr = ext.lower() == '.exr'
-        
-        # Use frames variable to store whatever frames we'll process (either original or converted)
-        frames = original_frames
-        
-        # For EXR files, convert to PNG first for better color management
-        if is_exr:
-            self.report({'INFO'}, f"🎨 Detected EXR frames, converting to PNG for proper color handling")
-            png_frames = self.convert_exr_to_png(frames_dir, blend_filename)
-            if png_frames and len(png_frames) > 0:
-                self.report({'INFO'}, f"🎨 Using converted PNG frames instead of EXR")
-                frames = png_frames
+            if result.returncode == 0:
+                version_line = result.stdout.split('\n')[0]
+                log.append(f"✅ FFmpeg found in PATH: {version_line}")
+                return 'ffmpeg'  # Use command name since it's in PATH
             else:
-                self.report({'WARNING'}, f"⚠️ PNG conversion failed, falling back to original EXR frames")
+                report({'ERROR'}, f"❌ FFmpeg check failed with error: {result.stderr}")
+        except FileNotFoundError:
+            report({'ERROR'}, "❌ FFmpeg not found in PATH")
+        
+        # We've exhausted all options (shutil.which above already covered
+        # anything the external 'which' command would find)
+        report({'ERROR'}, "❌ FFmpeg not found. Please install FFmpeg or update the PATH.")
+        report({'ERROR'}, "ℹ️ You might need to restart Blender after installing FFmpeg.")
+        
+        # Offer guidance based on platform
+        if sys.platform == 'darwin':
+            report({'ERROR'}, "ℹ️ On macOS, you can install FFmpeg with: brew install ffmpeg")
+        elif sys.platform == 'win32':
+            report({'ERROR'}, "ℹ️ On Windows, download FFmpeg from https://ffmpeg.org/download.html")
+        else:
+            report({'ERROR'}, "ℹ️ On Linux, use: sudo apt install ffmpeg or equivalent")
         
-        # Create temporary directory for frame processing
-        with tempfile.TemporaryDirectory() as temp_dir:
-            self.report({'INFO'}, f"📁 Created temporary directory: {temp_dir}")
-            
-            # Prepare frames (copy/rename for FFmpeg and handle looping)
-            total_frames = self.prepare_frames_for_ffmpeg(
-                frames, 
-                temp_dir, 
-                loop=loop, 
-                hold_frames=hold_frames
-            )
-            
-            if total_frames == 0:
-                self.report({'ERROR'}, "❌ No frames were prepared for FFmpeg")
-                return False
-            
-            # Determine quality settings
-            if quality == "high":
-                video_codec = "libx264"
-                crf_value = "18"
-                pixel_format = "yuv420p"
-                preset = "slow"
-            elif quality == "medium":
-                video_codec = "libx264"
-                crf_value = "23"
-                pixel_format = "yuv420p"
-                preset = "medium"
-            else:  # low
-                video_codec = "libx264"
-                crf_value = "28"
-                pixel_format = "yuv420p"
-                preset = "fast"
-            
-            # Make sure output directory exists
-            abs_output_file = bpy.path.abspath(output_file)
-            output_dir = os.path.dirname(abs_output_file)
-            if not os.path.exists(output_dir):
-                self.report({'INFO'}, f"📁 Creating output directory: {output_dir}")
-                os.makedirs(output_dir, exist_ok=True)
-            
-            # Get file extension for the frame sequence in temp_dir
-            first_frame = glob.glob(os.path.join(temp_dir, "frame_*.*"))[0]
-            frame_ext = os.path.splitext(first_frame)[1]
-            
-            # Build FFmpeg command with extensive options
-            cmd = [
-                ffmpeg_command, '-y',  # Use the found ffmpeg path
-                '-framerate', str(fps),
-                '-i', os.path.join(temp_dir, f'frame_%04d{frame_ext}'),
-                '-c:v', video_codec,
-                '-preset', preset,
-                '-crf', crf_value,
-                '-pix_fmt', pixel_format,
-                # Add additional FFmpeg options for high quality
-                '-profile:v', 'high',
-                '-level', '4.2',
-                '-movflags', '+faststart',  # Optimize for web streaming
-                abs_output_file
-            ]
-            
-            # Execute FFmpeg command
-            self.report({'INFO'}, f"🎞️ Running FFmpeg command:")
-            self.report({'INFO'}, f"🎞️ {' '.join(cmd)}")
+        return None
+    except Exception as e:
+        report({'ERROR'}, f"❌ Error checking FFmpeg: {str(e)}")
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _blender_ocio_config():
+    """Path to Blender's bundled OCIO config, or None when it can't be found.
+
+    $OCIO is normally unset inside Blender, so without an explicit config
+    OIIO would fall back to its built-in one, which knows neither
+    Blender's color space names nor its Filmic view.
+    """
+    config = os.path.join(bpy.utils.resource_path('LOCAL'), "datafiles",
+                          "colormanagement", "config.ocio")
+    if os.path.isfile(config):
+        return config
+    return os.environ.get("OCIO") or None
+
+
+def _convert_one_oiio(exr_path, png_path, ocio_config):
+    """Convert one EXR to PNG via OpenImageIO; returns True on success"""
+    import OpenImageIO as oiio
+
+    buf = oiio.ImageBuf(exr_path)
+    if buf.has_error:
+        return False
+    # Apply the same sRGB/Filmic display transform the bpy fallback (and
+    # Blender's own save_render) uses, out of Blender's OCIO config
+    buf = oiio.ImageBufAlgo.ociodisplay(buf, "sRGB", "Filmic",
+                                        colorconfig=ocio_config)
+    if buf.has_error:
+        return False
+    return buf.write(png_path)
+
+
+def _convert_exr_with_oiio(jobs, ocio_config, report, log):
+    """Convert (exr, png) pairs concurrently with OpenImageIO.
+
+    OIIO ships with Blender and releases the GIL during decode and
+    encode, so a thread pool gets real parallelism here — unlike a
+    process pool, which would fork/spawn the whole Blender binary.
+    Returns the jobs that failed so the caller can retry them.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = min(len(jobs), os.cpu_count() or 2)
+    log.append(f"🎨 Converting {len(jobs)} frames with OpenImageIO on {workers} threads")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda job: _convert_one_oiio(*job, ocio_config), jobs))
+    failed = [job for job, ok in zip(jobs, results) if not ok]
+    for exr_path, _ in failed:
+        report({'WARNING'}, f"⚠️ OpenImageIO failed to convert {exr_path}")
+    return failed
+
+
+def _convert_exr_with_bpy(jobs, report, log):
+    """Convert (exr, png) pairs serially through Blender's color management.
+
+    Fallback for builds without the OpenImageIO Python module; pays
+    bpy.data.images load/save overhead per frame.
+    """
+    # Temporary scene carrying the color-management settings for save_render
+    temp_scene = bpy.data.scenes.new("__temp_convert_scene")
+    temp_scene.view_settings.view_transform = 'Filmic'  # or 'Standard' depending on your preference
+    temp_scene.view_settings.look = 'None'
+    temp_scene.display_settings.display_device = 'sRGB'
+    temp_scene.render.image_settings.file_format = 'PNG'
+    temp_scene.render.image_settings.color_mode = 'RGBA'
+    temp_scene.render.image_settings.color_depth = '8'
+
+    try:
+        for i, (exr_path, png_path) in enumerate(jobs):
+            if i % 10 == 0 or i == len(jobs) - 1:  # Log progress every 10 frames and the last frame
+                _logger.debug("Converting frame %d/%d", i + 1, len(jobs))
+
+            # Load the EXR image
+            img_name = f"temp_convert_{i}"
+            if img_name in bpy.data.images:
+                bpy.data.images.remove(bpy.data.images[img_name])
+
             try:
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False
-                )
-                
-                if result.returncode == 0:
-                    self.report({'INFO'}, f"✅ FFmpeg successfully created video: {output_file}")
-                    # Check if the file was actually created
-                    if os.path.exists(abs_output_file):
-                        file_size = os.path.getsize(abs_output_file)
-                        self.report({'INFO'}, f"✅ Output file exists: {abs_output_file}")
-                        self.report({'INFO'}, f"✅ File size: {file_size / 1024 / 1024:.2f} MB")
-                    else:
-                        self.report({'WARNING'}, f"⚠️ FFmpeg reported success but output file not found: {abs_output_file}")
-                    return True
-                else:
-                    self.report({'ERROR'}, f"❌ FFmpeg error (code {result.returncode}):")
-                    for line in result.stderr.splitlines():
-                        self.report({'ERROR'}, f"❌ {line}")
-                    return False
+                img = bpy.data.images.load(exr_path)
+                img.name = img_name
             except Exception as e:
-                self.report({'ERROR'}, f"❌ Error running FFmpeg: {str(e)}")
-                return False
+                report({'ERROR'}, f"❌ Error loading EXR {exr_path}: {str(e)}")
+                continue
 
+            # Set color space explicitly
+            img.colorspace_settings.name = 'Linear'
 
-class RenderMobileOnlyOperator(Operator):
-    """Render only the mobile scenes"""
-    bl_idname = "export.render_mobile"
-    bl_label = "Render Mobile Only"
-    bl_options = {'REGISTER'}
+            # Save as PNG with color management applied
+            img.filepath_raw = png_path
+            img.file_format = 'PNG'
+
+            try:
+                img.save_render(png_path, scene=temp_scene)
+                _logger.debug("Saved PNG: %s", png_path)
+            except Exception as e:
+                report({'ERROR'}, f"❌ Error saving PNG {png_path}: {str(e)}")
+                continue
+
+            # Clean up
+            bpy.data.images.remove(img)
+
+    except Exception as e:
+        report({'ERROR'}, f"❌ Error during EXR to PNG conversion: {str(e)}")
+
+    finally:
+        # Clean up the temporary scene
+        bpy.data.scenes.remove(temp_scene)
+
+
+def _convert_exr_to_png(frames_dir, blend_filename, report, log):
+    """Convert EXR files to PNG with proper color management for better video encoding"""
+    log.append(f"🎨 Converting EXR files to PNG for proper color management")
+
+    # Find EXR frames
+    exr_frames = _find_frames(frames_dir, blend_filename, report, log)
+    if not exr_frames:
+        report({'WARNING'}, f"⚠️ No EXR frames found to convert")
+        return []
+
+    # Create a temporary directory for PNG frames
+    png_dir = os.path.join(bpy.path.abspath(frames_dir), "png_temp")
+    _ensure_dir(png_dir)
+    log.append(f"📁 Created PNG conversion directory: {png_dir}")
+
+    # Map each EXR to its PNG target, skipping frames already converted
+    targets = []
+    jobs = []
+    for exr_path in exr_frames:
+        basename = os.path.basename(exr_path)
+        frame_num = _frame_stem(basename)
+        if frame_num is None:
+            report({'WARNING'}, f"⚠️ Could not extract frame number from {basename}")
+            continue
+        png_path = os.path.join(png_dir, f"{blend_filename}_{frame_num}.png")
+        targets.append(png_path)
+        # Reuse a cached PNG only while it is newer than its EXR; a
+        # re-rendered frame invalidates the cache, an untouched one skips
+        # the decode entirely
+        try:
+            fresh = os.path.getmtime(png_path) >= os.path.getmtime(exr_path)
+        except OSError:
+            fresh = False
+        if fresh:
+            _logger.debug("PNG already up to date: %s", png_path)
+        else:
+            jobs.append((exr_path, png_path))
+
+    if jobs:
+        # The OIIO path needs both the module and Blender's OCIO config to
+        # reproduce the Filmic view; missing either, bpy does the transform
+        ocio_config = _blender_ocio_config()
+        try:
+            import OpenImageIO  # noqa: F401 — ships with Blender
+            has_oiio = ocio_config is not None
+        except ImportError:
+            has_oiio = False
+        if has_oiio:
+            failed = _convert_exr_with_oiio(jobs, ocio_config, report, log)
+            if failed:
+                log.append(f"🎨 Retrying {len(failed)} frames through Blender's color management")
+                _convert_exr_with_bpy(failed, report, log)
+        else:
+            _convert_exr_with_bpy(jobs, report, log)
+
+    # Re-check in frame order so conversion failures just drop out
+    png_frames = [path for path in targets if os.path.exists(path)]
+    log.append(f"✅ Converted {len(png_frames)}/{len(exr_frames)} EXR frames to PNG")
+    return png_frames
+
+
+def _find_frames(frames_dir, blend_filename, report, log):
+    """Find all frames in the directory and return sorted list"""
+    # Make sure we're using the right path format for Blender
+    abs_frames_dir = bpy.path.abspath(frames_dir)
+
+    log.append(f"🔍 Looking for frames in directory: {abs_frames_dir}")
+
+    # Check if directory exists
+    if not os.path.exists(abs_frames_dir):
+        report({'ERROR'}, f"❌ Frames directory does not exist: {abs_frames_dir}")
+        return []
+
+    # One scandir pass with a prefix test replaces the six glob patterns;
+    # startswith is a C-level string compare with no fnmatch translation
+    # and no extra stat per entry. Names are kept alongside paths so the
+    # sort key never has to re-derive the basename from the full path.
+    prefix = f"{blend_filename}_"
+    entries = []
+    with os.scandir(abs_frames_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith(prefix) and os.path.splitext(name)[1].lower() in _IMAGE_EXTS:
+                entries.append((name, entry.path))
+    log.append(f"🔍 Directory scan matched {len(entries)} frames with prefix '{prefix}'")
+
+    if not entries:
+        report({'WARNING'}, f"⚠️ No frames found matching filename pattern '{blend_filename}_*' in {abs_frames_dir}")
+        return []
+
+    # Sort numerically by the frame-number substring of the short name
+    # (same key the compositor setup uses), like "name_001.ext" -> 1
+    def frame_key(item):
+        stem = _frame_stem(item[0])
+        return int(stem) if stem else 0
+
+    # Zero-padded names mean directory order is usually already numeric;
+    # an O(N) scan over the keys then skips the sort entirely
+    keys = [frame_key(item) for item in entries]
+    if any(a > b for a, b in zip(keys, keys[1:])):
+        entries = [item for _, item in sorted(zip(keys, entries))]
+    all_frames = [path for _, path in entries]
+
+    # Log some frames for debugging
+    if len(all_frames) > 0:
+        log.append(f"✅ Found {len(all_frames)} frames in total")
+        log.append(f"📄 First frame: {os.path.basename(all_frames[0])}")
+        if len(all_frames) > 1:
+            log.append(f"📄 Second frame: {os.path.basename(all_frames[1])}")
+        log.append(f"📄 Last frame: {os.path.basename(all_frames[-1])}")
     
-    # Add additional FFmpeg options
-    quality: EnumProperty(
-        name="Quality",
-        description="Video quality",
-        items=[
-            ('high', "High", "High quality (larger file)"),
-            ('medium', "Medium", "Medium quality (balanced)"),
-            ('low', "Low", "Low quality (smaller file)")
-        ],
-        default='high'
-    )
+    return all_frames
+
+
+def _concat_entry(path):
+    """One concat-demuxer file directive, with single quotes escaped"""
+    return "file '" + os.path.abspath(path).replace("'", "'\\''") + "'\n"
+
+
+def _write_concat_list(frames, list_file, fps, loop=False, hold_frames=15):
+    """Write the FFmpeg concat list describing the frame sequence.
+
+    The concat demuxer reads frames straight from where Blender wrote
+    them, so no frames are staged or linked anywhere; hold frames are a
+    single duration directive instead of N directory entries.
+    """
+    frame_duration = 1.0 / fps
+    hold_duration = hold_frames / fps
+    total_frames = len(frames)
+
+    for frame_path in frames:
+        list_file.write(_concat_entry(frame_path))
+        list_file.write(f"duration {frame_duration:.6f}\n")
+
+    if loop and len(frames) > 1:
+        # Hold last frame, play back in reverse, hold first frame
+        list_file.write(_concat_entry(frames[-1]))
+        list_file.write(f"duration {hold_duration:.6f}\n")
+        for frame_path in reversed(frames):
+            list_file.write(_concat_entry(frame_path))
+            list_file.write(f"duration {frame_duration:.6f}\n")
+        list_file.write(_concat_entry(frames[0]))
+        list_file.write(f"duration {hold_duration:.6f}\n")
+        total_frames = 2 * len(frames) + 2 * hold_frames
+
+    # The demuxer ignores the duration on the final entry, so repeat it
+    # once without a duration to keep the last frame on screen
+    last = frames[0] if loop and len(frames) > 1 else frames[-1]
+    list_file.write(_concat_entry(last))
+    list_file.flush()
+    return total_frames
+
+
+def _build_encode_command(frames_dir, output_file, blend_filename, fps=30,
+                          loop=False, hold_frames=15, quality="high", crf=23,
+                          threads=None, report=None, log=None):
+    """Resolve frames and build the FFmpeg argv for one channel's encode.
+
+    Returns ``(cmd, concat_path)``, or ``(None, None)`` when the encode
+    cannot run. The caller owns the concat list file and removes it once
+    FFmpeg exits — which lets it run the process synchronously or keep it
+    in the background and reap it later. ``threads`` caps the encoder's
+    thread pool; leave it None for a lone encode so x264 uses every core.
+    """
+    if report is None:
+        report = _print_report
+    if log is None:
+        log = []
+    import tempfile
+
+    # Check if FFmpeg is available
+    ffmpeg_command = _find_ffmpeg(report, log)
+    if ffmpeg_command is None:
+        report({'ERROR'}, "❌ FFmpeg is required but not found. Please install FFmpeg.")
+        return None, None
     
-    custom_fps: IntProperty(
-        name="Frame Rate",
-        description="Custom frame rate for the video (0 = use scene settings)",
-        min=0, max=120,
-        default=0
-    )
+    # Find original frames to check format
+    log.append(f"🔍 Checking frames in {frames_dir}")
+    original_frames = _find_frames(frames_dir, blend_filename, report, log)
     
-    custom_crf: IntProperty(
-        name="CRF Value",
-        description="Constant Rate Factor (lower = higher quality, higher = smaller file)",
-        min=0, max=51,
-        default=23
-    )
+    if not original_frames:
+        report({'WARNING'}, f"⚠️ No frames found in {frames_dir}")
+        return None, None
     
-    def invoke(self, context, event):
-        return context.window_manager.invoke_props_dialog(self)
+    # Check if we have EXR files that need conversion
+    _, ext = os.path.splitext(original_frames[0])
+    is_exr = ext.lower() == '.exr'
     
-    def draw(self, context):
-        layout = self.layout
-        layout.prop(self, "quality")
-        layout.prop(self, "custom_fps")
-        layout.prop(self, "custom_crf")
+    # Use frames variable to store whatever frames we'll process (either original or converted)
+    frames = original_frames
     
+    # For EXR files, convert to PNG first for better color management
+    if is_exr:
+        log.append(f"🎨 Detected EXR frames, converting to PNG for proper color handling")
+        png_frames = _convert_exr_to_png(frames_dir, blend_filename, report, log)
+        if png_frames and len(png_frames) > 0:
+            log.append(f"🎨 Using converted PNG frames instead of EXR")
+            frames = png_frames
+        else:
+            report({'WARNING'}, f"⚠️ PNG conversion failed, falling back to original EXR frames")
+    
+    # Describe the sequence (including loop and holds) in a concat list
+    # instead of staging renamed frames: FFmpeg reads the frames straight
+    # from where Blender wrote them, so the temp-dir copy pass disappears
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as list_file:
+        concat_path = list_file.name
+        total_frames = _write_concat_list(frames, list_file, fps,
+                                          loop=loop, hold_frames=hold_frames)
+    log.append(f"📄 Wrote concat list for {total_frames} frames: {concat_path}")
+
+    pixel_format = "yuv420p"
+    crf_value, preset = _QUALITY_PRESETS.get(quality, _QUALITY_PRESETS["low"])
+
+    # Prefer hardware encoding on CUDA hosts: NVENC encodes at a
+    # fraction of libx264's CPU cost, so the encode stage stops
+    # competing with any renders still running
+    if _nvenc_usable(ffmpeg_command):
+        log.append("🎞️ Using NVENC hardware encoder")
+        codec_args = [
+            '-c:v', 'h264_nvenc',
+            '-preset', 'p5',
+            '-tune', 'hq',
+            '-rc', 'vbr',
+            '-cq', crf_value,
+        ]
+    else:
+        codec_args = [
+            '-c:v', 'libx264',
+            '-preset', preset,
+            # Rendered frame sequences are animation content: this
+            # tune raises deblocking and B-frame counts for smaller
+            # files at the same CRF
+            '-tune', 'animation',
+            '-crf', crf_value,
+            # One keyframe per second: CG sequences compress well between
+            # keyframes, and the fixed GOP keeps seeking predictable
+            '-g', str(fps),
+        ]
+        # Same core-splitting idea as the render pool: two concurrent
+        # x264 encodes with unbounded thread pools just oversubscribe
+        # each other
+        if threads is not None:
+            codec_args += ['-threads', str(threads)]
+
+    # Make sure output directory exists
+    abs_output_file = bpy.path.abspath(output_file)
+    output_dir = os.path.dirname(abs_output_file)
+    _ensure_dir(output_dir)
+
+    # Build FFmpeg command with extensive options. -safe 0 permits the
+    # absolute paths in the list; -vsync vfr honors the per-entry
+    # durations and -r fixes the output frame rate
+    cmd = [
+        ffmpeg_command, '-y',  # Use the found ffmpeg path
+        # Errors only on stderr: the default per-frame progress lines
+        # accumulate without bound in the captured pipe and can fill it,
+        # stalling FFmpeg on long encodes that nobody is reading yet
+        '-loglevel', 'error',
+        '-nostats',
+        '-f', 'concat',
+        '-safe', '0',
+        '-i', concat_path,
+        '-vsync', 'vfr',
+        '-r', str(fps),
+        *codec_args,
+        '-pix_fmt', pixel_format,
+        # Add additional FFmpeg options for high quality
+        '-profile:v', 'high',
+        '-level', '4.2',
+        '-movflags', '+faststart',  # Optimize for web streaming
+        abs_output_file
+    ]
+    return cmd, concat_path
+
+
+def create_video_with_ffmpeg(frames_dir, output_file, blend_filename, fps=30,
+                             loop=False, hold_frames=15, quality="high", crf=23,
+                             report=None):
+    """Use FFmpeg to create video from frames with proper color management.
+
+    ``report`` follows the Operator.report signature; INFO lines are
+    buffered and flushed as a single report on return. Runs the encode to
+    completion — callers that want concurrent encodes use
+    ``_build_encode_command`` and manage the process themselves.
+    """
+    if report is None:
+        report = _print_report
+    log = []
+    import subprocess
+
+    cmd, concat_path = _build_encode_command(
+        frames_dir, output_file, blend_filename, fps=fps,
+        loop=loop, hold_frames=hold_frames, quality=quality, crf=crf,
+        report=report, log=log)
+    if cmd is None:
+        _flush(report, log)
+        return False
+
+    abs_output_file = bpy.path.abspath(output_file)
+
+    # Execute FFmpeg command; the full argv is debug-only so the join is
+    # never paid unless someone is actually reading it
+    log.append("🎞️ Running FFmpeg...")
+    _logger.debug("FFmpeg command: %s", cmd)
+    try:
+        # Capture bytes and decode only if something went wrong: text=True
+        # would decode everything with the locale codec, which on Windows
+        # can raise on unicode paths echoed back by FFmpeg
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=False
+        )
+
+        if result.returncode == 0:
+            log.append(f"✅ FFmpeg successfully created video: {output_file}")
+            # Check if the file was actually created
+            if os.path.exists(abs_output_file):
+                file_size = os.path.getsize(abs_output_file)
+                log.append(f"✅ Output file exists: {abs_output_file}")
+                log.append(f"✅ File size: {file_size / 1024 / 1024:.2f} MB")
+            else:
+                report({'WARNING'}, f"⚠️ FFmpeg reported success but output file not found: {abs_output_file}")
+            _flush(report, log)
+            return True
+        else:
+            report({'ERROR'}, f"❌ FFmpeg error (code {result.returncode}):")
+            stderr = result.stderr.decode('utf-8', errors='replace') if result.stderr else ""
+            for line in stderr.splitlines():
+                report({'ERROR'}, f"❌ {line}")
+            _flush(report, log)
+            return False
+    except Exception as e:
+        report({'ERROR'}, f"❌ Error running FFmpeg: {str(e)}")
+        _flush(report, log)
+        return False
+    finally:
+        try:
+            os.unlink(concat_path)
+        except OSError:
+            pass
+
+
+class _RenderBatch:
+    """One RenderAllOperator run: worker pool state polled from an app timer.
+
+    Plain Python object rather than operator state: Blender may release
+    the wmOperator as soon as execute returns FINISHED, so the timer
+    callback must not touch it. Progress goes to stdout for the same
+    reason — operator reports issued after FINISHED never reach the UI.
+    """
+
+    def __init__(self, concurrency, blend_filepath, blend_filename,
+                 pending, chunks_left):
+        self.concurrency = concurrency
+        self.blend_filepath = blend_filepath
+        self.blend_filename = blend_filename
+        self.pending = pending
+        self.chunks_left = chunks_left
+        self.running = []
+        self.encoding = []
+        self.spawned = 0
+        self.any_encoded = False
+
+    def poll(self):
+        """Timer callback: reap finished render processes and start queued ones"""
+        for entry in list(self.running):
+            scene_name, proc, err_file = entry
+            if proc.poll() is None:
+                continue
+            self.running.remove(entry)
+            if proc.returncode == 0:
+                self.chunks_left[scene_name] -= 1
+                if self.chunks_left[scene_name] == 0:
+                    print(f"✅ Finished rendering {scene_name}")
+                    # Encode this channel's video right away so the CPU-bound
+                    # x264 pass overlaps whatever renders are still in flight
+                    self._encode_scene(scene_name)
+            else:
+                err_file.seek(0)
+                stderr = err_file.read().decode(errors='replace')
+                print(f"❌ Render failed for {scene_name} (code {proc.returncode})")
+                if stderr:
+                    print(stderr)
+                # Poison the counter so a partial scene is never encoded
+                self.chunks_left[scene_name] = -1
+            err_file.close()
+
+        # Reap background encodes; both channels' FFmpeg processes can run
+        # at once, so two workers finishing close together encode
+        # concurrently instead of back to back on the main thread
+        for job in list(self.encoding):
+            if job["proc"].poll() is None:
+                continue
+            self.encoding.remove(job)
+            self._finish_encode(job)
+
+        while self.pending and len(self.running) < self.concurrency:
+            scene_name, frame_start, frame_end = self.pending.pop(0)
+            device_index = self.spawned % self.concurrency
+            self.spawned += 1
+            print(f"🎬 Starting background render for {scene_name} (device slot {device_index})...")
+            proc, err_file = _spawn_render(scene_name, self.blend_filepath,
+                                           device_index, frame_start, frame_end)
+            self.running.append((scene_name, proc, err_file))
+
+        if self.running or self.pending or self.encoding:
+            return 1.0
+
+        # All frame renders finished; each video was encoded as its worker
+        # exited, so only the final status is left to report
+        if self.any_encoded:
+            print("✅ All rendering complete!")
+        else:
+            print("❌ No frames were found to render!")
+        return None
+
+    def _encode_scene(self, scene_name):
+        """Start one channel's encode as soon as its frames are rendered.
+
+        Spawns FFmpeg as a background process and hands it to the poll
+        timer: the encode overlaps the renders still in flight, and the
+        two channels' encodes overlap each other when both finish close
+        together.
+        """
+        import subprocess
+
+        target_key = next((k for k, t in PIPELINE_TARGETS.items() if t.scene_name == scene_name), None)
+        if target_key is None:
+            return False
+        target = PIPELINE_TARGETS[target_key]
+
+        blend_filename = self.blend_filename
+
+        # Get looping settings from control scene; bind the collection once
+        # rather than probing bpy.data.scenes per lookup
+        scenes = bpy.data.scenes
+        control_scene = scenes.get("ControlScene", bpy.context.scene)
+        settings = control_scene.mce
+        frames_dir = _frames_dir_for(target, settings)
+
+        # Check frames exist before spinning up the heavier video pipeline
+        if not _any_matching(frames_dir, blend_filename):
+            print(f"⚠️ No {target.label} frames found in {frames_dir}")
+            return False
+
+        # Use the source scene's FPS
+        source_scene = scenes.get(target.scene_name)
+        fps = source_scene.render.fps if source_scene else 30
+
+        # Skip the encode when the frames and parameters match the last run;
+        # same signature (and key) the single-channel operators maintain.
+        # The trailing values are create_video_with_ffmpeg's defaults.
+        output_file = f"{target.out_dir}{blend_filename}.mp4"
+        signature = _encode_signature(frames_dir, blend_filename,
+                                      settings.loop_extend_frames, settings.hold_frames,
+                                      "high", fps, 23)
+        sig_key = "mce_last_encode_" + target_key
+        if control_scene.get(sig_key) == signature and os.path.exists(_abspath(output_file)):
+            print(f"✅ {target.label} video already up to date, skipping encode")
+            self.any_encoded = True
+            return True
+
+        print(f"🎞️ Creating {target.label} video at {fps} fps...")
+        log = []
+        cmd, concat_path = _build_encode_command(
+            frames_dir=frames_dir,
+            output_file=output_file,
+            blend_filename=blend_filename,
+            fps=fps,
+            loop=settings.loop_extend_frames,
+            hold_frames=settings.hold_frames,
+            # Both channels may encode at once; give each half the cores
+            threads=max(1, (os.cpu_count() or 2) // len(PIPELINE_TARGETS)),
+            report=_print_report,
+            log=log
+        )
+        _flush(_print_report, log)
+        if cmd is None:
+            return False
+
+        self.encoding.append({
+            "proc": subprocess.Popen(cmd,
+                                     stdout=subprocess.DEVNULL,
+                                     stderr=subprocess.PIPE),
+            "concat_path": concat_path,
+            "target": target,
+            "sig_key": sig_key,
+            "signature": signature,
+            "frames_dir": frames_dir,
+            "output_file": output_file,
+        })
+        return True
+
+    def _finish_encode(self, job):
+        """Handle a background FFmpeg exit: report and store the skip signature"""
+        proc = job["proc"]
+        target = job["target"]
+        try:
+            os.unlink(job["concat_path"])
+        except OSError:
+            pass
+
+        if proc.returncode != 0:
+            stderr = proc.stderr.read().decode(errors='replace') if proc.stderr else ""
+            print(f"❌ FFmpeg failed for {target.label} (code {proc.returncode})")
+            if stderr:
+                print(stderr)
+            return
+
+        self.any_encoded = True
+        print(f"✅ {target.label} video created: {job['output_file']}")
+
+        scenes = bpy.data.scenes
+        control_scene = scenes.get("ControlScene", bpy.context.scene)
+        control_scene[job["sig_key"]] = job["signature"]
+
+        # Staged frames live in RAM; reclaim them once encoded
+        if control_scene.mce.frame_staging_dir:
+            import shutil
+            staged_dir = _abspath(job["frames_dir"])
+            shutil.rmtree(staged_dir, ignore_errors=True)
+            _forget_dir(staged_dir)
+
+
+class RenderAllOperator(Operator):
+    """Render all scenes in background processes, then composite videos"""
+    bl_idname = "export.render_all"
+    bl_label = "Render All Scenes"
+    bl_options = {'REGISTER'}
+
+    render_concurrency: IntProperty(
+        name="Render Concurrency",
+        description="Maximum number of background Blender processes rendering at once",
+        min=1, max=8,
+        default=2
+    )
+
     def execute(self, context):
-        # Store original scene
-        original_scene = context.window.scene.name
+        # Enhanced debugging
+        self.report({'INFO'}, f"🏁 Starting multi-channel export render process")
+        self.report({'INFO'}, f"📄 Current Blender version: {bpy.app.version_string}")
         
-        # Get the current blend file name
+        # Get the current blend file name and path
         blend_filepath = bpy.data.filepath
         if not blend_filepath:
-            self.report({'ERROR'}, "Please save your file first")
+            self.report({'ERROR'}, "❌ Please save your file first")
             return {'CANCELLED'}
         
-        blend_filename = os.path.splitext(os.path.basename(blend_filepath))[0]
-        output_dir = "//Output/"
-        
-        # Step 1: Render the main scene
-        scene_name = "MobileScene"
-        if scene_name in bpy.data.scenes:
-            self.report({'INFO'}, f"Rendering {scene_name}...")
-            
-            # Switch to the scene
-            context.window.scene = bpy.data.scenes[scene_name]
-            
-            # Force screen update
-            bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
-            
-            # Render animation for this scene
-            bpy.ops.render.render(animation=True)
-            
-            self.report({'INFO'}, f"Finished rendering {scene_name}")
-        else:
-            self.report({'WARNING'}, f"Scene {scene_name} not found!")
-        
-        # Step 2: Create video from the frames
-        # Get looping settings from control scene
-        control_scene = bpy.data.scenes.get("ControlScene", context.scene)
-        loop_extend_frames = control_scene.loop_extend_frames
-        hold_frames = control_scene.hold_frames
-        
-        # Determine FPS
-        fps = self.custom_fps
-        if fps == 0:
-            # Use scene FPS
-            fps = bpy.data.scenes.get(scene_name, context.scene).render.fps
-        
-        # Use the all renderer to create video
-        all_renderer = RenderAllOperator()
-        all_renderer.report = self.report
-        
-        success = all_renderer.create_video_with_ffmpeg(
-            frames_dir=output_dir + "MobileFrames/",
-            output_file=output_dir + "MobileOut/" + blend_filename + ".mp4",
-            blend_filename=blend_filename,
-            fps=fps,
-            loop=loop_extend_frames,
-            hold_frames=hold_frames,
-            quality=self.quality,
-            crf=self.custom_crf
-        )
-        
-        # Return to original scene
-        context.window.scene = bpy.data.scenes[original_scene]
+        blend_dir = os.path.dirname(blend_filepath)
+        blend_filename = _resolve_paths(blend_filepath).blend_filename
+        self.report({'INFO'}, f"📄 Blend file: {blend_filepath}")
+        self.report({'INFO'}, f"📁 Working directory: {blend_dir}")
         
-        if success:
-            self.report({'INFO'}, "Mobile rendering complete!")
-            return {'FINISHED'}
-        else:
-            self.report({'WARNING'}, "Mobile rendering encountered issues")
+        # Render frames first, then render videos
+        frame_scenes = [target.scene_name for target in PIPELINE_TARGETS.values()]
+
+        # Resolve all scene lookups once; per-iteration membership tests plus
+        # subscripts cost two PyRNA collection probes each
+        scenes = bpy.data.scenes
+        resolved = [(name, scenes.get(name)) for name in frame_scenes]
+
+        # Give each worker a fixed share of the physical cores. AUTO lets
+        # every worker claim all SMT siblings, and concurrent CPU renders
+        # then oversubscribe each other
+        workers = max(1, self.render_concurrency)
+        threads = max(1, (os.cpu_count() or 2) // 2 // workers)
+        for _, scene in resolved:
+            if scene is not None:
+                scene.render.threads_mode = 'FIXED'
+                scene.render.threads = threads
+
+        # Save the file so background processes see the current scene state
+        bpy.ops.wm.save_mainfile()
+
+        # Queue up the scenes that actually exist
+        alive = []
+        for scene_name, scene in resolved:
+            if scene is None:
+                self.report({'WARNING'}, f"⚠️ Scene {scene_name} not found!")
+                continue
+
+            self.report({'INFO'}, f"🎬 Queued {scene_name} for background render")
+            self.report({'INFO'}, f"🔄 Output path: {scene.render.filepath}")
+            self.report({'INFO'}, f"🔄 Format: {scene.render.image_settings.file_format}")
+
+            # Check if output directory exists
+            output_dir = os.path.dirname(bpy.path.abspath(scene.render.filepath))
+            _ensure_dir(output_dir)
+
+            alive.append((scene_name, scene))
+
+        if not alive:
+            self.report({'ERROR'}, "❌ No scenes found to render!")
             return {'CANCELLED'}
 
+        # Spare worker slots split each scene's frame range into segments:
+        # with more slots than scenes, one long animation still keeps every
+        # worker busy. Segments share the scene's output directory and real
+        # frame numbers, so the encode needs no reassembly.
+        segments = max(1, workers // len(alive))
+        pending = []
+        chunks_left = {}
+        for scene_name, scene in alive:
+            start, end = scene.frame_start, scene.frame_end
+            parts = min(segments, max(1, end - start + 1))
+            if parts == 1:
+                pending.append((scene_name, None, None))
+            else:
+                total = end - start + 1
+                bounds = [start + (total * i) // parts for i in range(parts)] + [end + 1]
+                for i in range(parts):
+                    pending.append((scene_name, bounds[i], bounds[i + 1] - 1))
+                self.report({'INFO'}, f"🎬 Split {scene_name} frames {start}-{end} across {parts} workers")
+            chunks_left[scene_name] = parts
 
-class RenderDesktopOnlyOperator(Operator):
-    """Render only the desktop scenes"""
-    bl_idname = "export.render_desktop"
-    bl_label = "Render Desktop Only"
-    bl_options = {'REGISTER'}
-    
-    # Add additional FFmpeg options
-    quality: EnumProperty(
+        # Poll the workers from a main-thread timer; bpy.data must never be
+        # touched from a worker, so all follow-up work happens in the callback.
+        # The batch object carries all state: the operator itself may be
+        # released by Blender as soon as execute returns FINISHED, so the
+        # timer must not dereference it.
+        batch = _RenderBatch(self.render_concurrency, blend_filepath,
+                             blend_filename, pending, chunks_left)
+        self.report({'INFO'}, f"🎬 --- Rendering Frames in Background (up to {self.render_concurrency} at a time) ---")
+        bpy.app.timers.register(batch.poll, first_interval=1.0)
+        return {'FINISHED'}
+
+
+# Encode options shared by the single-channel operators. bpy reads property
+# definitions from __annotations__ at registration, so each concrete class
+# takes a copy of this dict instead of restating the same three blocks.
+_VIDEO_PROPS = {
+    "quality": EnumProperty(
         name="Quality",
         description="Video quality",
         items=[
@@ -727,99 +1125,218 @@ class RenderDesktopOnlyOperator(Operator):
             ('low', "Low", "Low quality (smaller file)")
         ],
         default='high'
-    )
-    
-    custom_fps: IntProperty(
+    ),
+    "custom_fps": IntProperty(
         name="Frame Rate",
         description="Custom frame rate for the video (0 = use scene settings)",
         min=0, max=120,
         default=0
-    )
-    
-    custom_crf: IntProperty(
+    ),
+    "custom_crf": IntProperty(
         name="CRF Value",
         description="Constant Rate Factor (lower = higher quality, higher = smaller file)",
         min=0, max=51,
         default=23
-    )
-    
+    ),
+}
+
+
+class RenderSceneModalMixin:
+    """Shared modal render + FFmpeg pipeline for the single-channel operators.
+
+    Concrete operators set ``target_key`` to a key in PIPELINE_TARGETS and
+    declare the quality/custom_fps/custom_crf properties.
+    """
+    target_key = ""
+    _timer = None
+    # Assigned in execute; class-level defaults keep _remove_handlers safe
+    # when the props dialog is cancelled before execute ever runs
+    _complete_handler = None
+    _cancel_handler = None
+
     def invoke(self, context, event):
         return context.window_manager.invoke_props_dialog(self)
-    
+
     def draw(self, context):
         layout = self.layout
         layout.prop(self, "quality")
         layout.prop(self, "custom_fps")
         layout.prop(self, "custom_crf")
-    
+
     def execute(self, context):
-        # Store original scene
-        original_scene = context.window.scene.name
-        
+        target = PIPELINE_TARGETS[self.target_key]
+
         # Get the current blend file name
         blend_filepath = bpy.data.filepath
         if not blend_filepath:
             self.report({'ERROR'}, "Please save your file first")
             return {'CANCELLED'}
-        
-        blend_filename = os.path.splitext(os.path.basename(blend_filepath))[0]
-        output_dir = "//Output/"
-        
-        # Step 1: Render the main scene
-        scene_name = "DesktopScene"
-        if scene_name in bpy.data.scenes:
+
+        self._blend_filename = _resolve_paths(blend_filepath).blend_filename
+        self._render_done = False
+        self._render_cancelled = False
+
+        # Step 1: Render the main scene without blocking the UI
+        scene_name = target.scene_name
+        scene = bpy.data.scenes.get(scene_name)
+        if scene is not None:
             self.report({'INFO'}, f"Rendering {scene_name}...")
-            
-            # Switch to the scene
-            context.window.scene = bpy.data.scenes[scene_name]
-            
-            # Force screen update
-            bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
-            
-            # Render animation for this scene
-            bpy.ops.render.render(animation=True)
-            
-            self.report({'INFO'}, f"Finished rendering {scene_name}")
-        else:
-            self.report({'WARNING'}, f"Scene {scene_name} not found!")
-        
+
+            # Render handlers flip flags the modal loop picks up; they must
+            # not touch the UI themselves
+            def _complete(*args, _self=self):
+                _self._render_done = True
+
+            def _cancel(*args, _self=self):
+                _self._render_cancelled = True
+
+            self._complete_handler = _complete
+            self._cancel_handler = _cancel
+            bpy.app.handlers.render_complete.append(_complete)
+            bpy.app.handlers.render_cancel.append(_cancel)
+
+            # Scope the render to the target scene without mutating the
+            # user-visible window scene (no depsgraph rebuild, no restore)
+            with context.temp_override(window=context.window, scene=scene):
+                bpy.ops.render.render('INVOKE_DEFAULT', animation=True)
+            self._timer = context.window_manager.event_timer_add(0.5, window=context.window)
+            context.window_manager.modal_handler_add(self)
+            return {'RUNNING_MODAL'}
+
+        self.report({'WARNING'}, f"Scene {scene_name} not found!")
+        return self._finish(context)
+
+    def modal(self, context, event):
+        target = PIPELINE_TARGETS[self.target_key]
+
+        if event.type == 'ESC' or self._render_cancelled:
+            self._remove_handlers(context)
+            self.report({'WARNING'}, f"{target.label} render cancelled")
+            return {'CANCELLED'}
+
+        if event.type == 'TIMER' and self._render_done:
+            self._remove_handlers(context)
+            self.report({'INFO'}, f"Finished rendering {target.scene_name}")
+            return self._finish(context)
+
+        return {'PASS_THROUGH'}
+
+    def cancel(self, context):
+        self._remove_handlers(context)
+
+    def _remove_handlers(self, context):
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        if self._complete_handler and self._complete_handler in bpy.app.handlers.render_complete:
+            bpy.app.handlers.render_complete.remove(self._complete_handler)
+        if self._cancel_handler and self._cancel_handler in bpy.app.handlers.render_cancel:
+            bpy.app.handlers.render_cancel.remove(self._cancel_handler)
+
+    def _finish(self, context):
         # Step 2: Create video from the frames
-        # Get looping settings from control scene
-        control_scene = bpy.data.scenes.get("ControlScene", context.scene)
-        loop_extend_frames = control_scene.loop_extend_frames
-        hold_frames = control_scene.hold_frames
-        
+        target = PIPELINE_TARGETS[self.target_key]
+        blend_filename = self._blend_filename
+
+        # Get looping settings from control scene; bind the collection once
+        scenes = bpy.data.scenes
+        control_scene = scenes.get("ControlScene", context.scene)
+        settings = control_scene.mce
+        loop_extend_frames = settings.loop_extend_frames
+        hold_frames = settings.hold_frames
+
         # Determine FPS
         fps = self.custom_fps
         if fps == 0:
             # Use scene FPS
-            fps = bpy.data.scenes.get(scene_name, context.scene).render.fps
-        
-        # Use the all renderer to create video
-        all_renderer = RenderAllOperator()
-        all_renderer.report = self.report
-        
-        success = all_renderer.create_video_with_ffmpeg(
-            frames_dir=output_dir + "DesktopFrames/",
-            output_file=output_dir + "DesktopOut/" + blend_filename + ".mp4",
+            fps = scenes.get(target.scene_name, context.scene).render.fps
+
+        # Skip the encode when the frames and parameters match the last run
+        frames_dir = _frames_dir_for(target, settings)
+        output_file = f"{target.out_dir}{blend_filename}.mp4"
+        signature = _encode_signature(frames_dir, blend_filename, loop_extend_frames,
+                                      hold_frames, self.quality, fps, self.custom_crf)
+        sig_key = "mce_last_encode_" + self.target_key
+        if control_scene.get(sig_key) == signature and os.path.exists(bpy.path.abspath(output_file)):
+            self.report({'INFO'}, f"{target.label} video already up to date, skipping encode")
+            return {'FINISHED'}
+
+        import subprocess
+
+        log = []
+        cmd, concat_path = _build_encode_command(
+            frames_dir=frames_dir,
+            output_file=output_file,
             blend_filename=blend_filename,
             fps=fps,
             loop=loop_extend_frames,
             hold_frames=hold_frames,
             quality=self.quality,
-            crf=self.custom_crf
+            crf=self.custom_crf,
+            report=self.report,
+            log=log
         )
-        
-        # Return to original scene
-        context.window.scene = bpy.data.scenes[original_scene]
-        
-        if success:
-            self.report({'INFO'}, "Desktop rendering complete!")
-            return {'FINISHED'}
-        else:
-            self.report({'WARNING'}, "Desktop rendering encountered issues")
+        _flush(self.report, log)
+        if cmd is None:
+            self.report({'WARNING'}, f"{target.label} rendering encountered issues")
             return {'CANCELLED'}
 
+        # Run FFmpeg in the background and watch it from an app timer:
+        # blocking the main thread for the whole encode froze the UI for
+        # minutes on long sequences. The closure holds everything it
+        # needs, since the operator is gone by the time FFmpeg exits.
+        proc = subprocess.Popen(cmd,
+                                stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE)
+        label = target.label
+        control_name = control_scene.name
+        abs_output = bpy.path.abspath(output_file)
+
+        def _poll_encode():
+            if proc.poll() is None:
+                return 0.5
+            try:
+                os.unlink(concat_path)
+            except OSError:
+                pass
+            if proc.returncode == 0:
+                scene = bpy.data.scenes.get(control_name)
+                if scene is not None:
+                    scene[sig_key] = signature
+                print(f"✅ {label} video created: {abs_output}")
+            else:
+                stderr = proc.stderr.read().decode('utf-8', errors='replace') if proc.stderr else ""
+                print(f"❌ FFmpeg failed for {label} (code {proc.returncode})")
+                if stderr:
+                    print(stderr)
+            return None
+
+        bpy.app.timers.register(_poll_encode, first_interval=0.5)
+        self.report({'INFO'}, f"{target.label} render done; encoding video in the background")
+        return {'FINISHED'}
+
+
+class RenderMobileOnlyOperator(RenderSceneModalMixin, Operator):
+    """Render only the mobile scenes"""
+    bl_idname = "export.render_mobile"
+    bl_label = "Render Mobile Only"
+    bl_options = {'REGISTER'}
+
+    target_key = "mobile"
+
+    __annotations__ = dict(_VIDEO_PROPS)
+
+
+class RenderDesktopOnlyOperator(RenderSceneModalMixin, Operator):
+    """Render only the desktop scenes"""
+    bl_idname = "export.render_desktop"
+    bl_label = "Render Desktop Only"
+    bl_options = {'REGISTER'}
+
+    target_key = "desktop"
+
+    __annotations__ = dict(_VIDEO_PROPS)
+
 
 class AdvancedRenderSettingsOperator(Operator):
     """Configure advanced render settings"""
@@ -917,9 +1434,10 @@ class AdvancedRenderSettingsOperator(Operator):
     def invoke(self, context, event):
         # Initialize with current scene settings
         control_scene = bpy.data.scenes.get("ControlScene", context.scene)
-        self.create_loop = control_scene.loop_extend_frames
-        self.forward_hold_frames = control_scene.hold_frames
-        self.reverse_hold_frames = control_scene.hold_frames
+        settings = control_scene.mce
+        self.create_loop = settings.loop_extend_frames
+        self.forward_hold_frames = settings.hold_frames
+        self.reverse_hold_frames = settings.hold_frames
         
         return context.window_manager.invoke_props_dialog(self, width=400)
     
@@ -955,8 +1473,9 @@ class AdvancedRenderSettingsOperator(Operator):
         # Save settings to scene properties
         control_scene = bpy.data.scenes.get("ControlScene", context.scene)
         if control_scene:
-            control_scene.loop_extend_frames = self.create_loop
-            control_scene.hold_frames = self.forward_hold_frames
+            settings = control_scene.mce
+            settings.loop_extend_frames = self.create_loop
+            settings.hold_frames = self.forward_hold_frames
             
             # Add custom properties for additional settings
             control_scene['ffmpeg_video_codec'] = self.video_codec
@@ -984,8 +1503,13 @@ class SwitchToSceneOperator(Operator):
     )
     
     def execute(self, context):
-        if self.scene_name in bpy.data.scenes:
-            context.window.scene = bpy.data.scenes[self.scene_name]
+        # Single collection probe instead of a membership test plus subscript
+        scene = bpy.data.scenes.get(self.scene_name)
+        if scene is not None:
+            # Re-assigning the current scene still fires a full scene-change
+            # event (depsgraph rebuild plus editor notifiers), so skip it
+            if context.window.scene is not scene:
+                context.window.scene = scene
             self.report({'INFO'}, f"Switched to {self.scene_name}")
         else:
             self.report({'ERROR'}, f"Scene {self.scene_name} not found!")
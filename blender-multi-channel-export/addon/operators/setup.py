@@ -1,9 +1,295 @@
 import bpy
 import os
-import glob
 from bpy.props import BoolProperty, StringProperty, IntProperty
 from bpy.types import Operator
 
+from .render import _IMAGE_EXTS, _ensure_dir, _resolve_paths
+
+def _frames_exist(input_dir, blend_filename):
+    """Cheap scandir probe for rendered frames, stopping at the first hit"""
+    abs_dir = bpy.path.abspath(input_dir)
+    if not os.path.isdir(abs_dir):
+        return False
+    needle = blend_filename + "_"
+    with os.scandir(abs_dir) as it:
+        return any(entry.name.startswith(needle)
+                   and os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTS
+                   for entry in it)
+
+
+def _sorted_frame_files(dirpath, prefix):
+    """Rendered frame paths in numeric frame order from one scandir pass"""
+    abs_dir = bpy.path.abspath(dirpath)
+    if not os.path.isdir(abs_dir):
+        return []
+    needle = prefix + "_"
+    entries = [e for e in os.scandir(abs_dir)
+               if e.name.startswith(needle)
+               and os.path.splitext(e.name)[1].lower() in _IMAGE_EXTS]
+
+    def frame_key(entry):
+        stem = entry.name.rsplit("_", 1)[1].split(".", 1)[0]
+        return int(stem) if stem.isdigit() else 0
+
+    entries.sort(key=frame_key)
+    return [e.path for e in entries]
+
+
+def _assign_strip_elements(strip, frames):
+    """Give an image strip an explicit filename-per-frame table.
+
+    With just use_sequence Blender pattern-matches the directory to locate
+    each frame during playback and encode; a populated elements collection
+    turns that into an indexed lookup.
+    """
+    if hasattr(strip, "elements"):
+        # The collection can't be emptied, so pop to one entry and
+        # retarget it — a reused strip otherwise keeps its old first frame
+        while len(strip.elements) > 1:
+            strip.elements.pop()
+        strip.elements[0].filename = os.path.basename(frames[0])
+        for frame_path in frames[1:]:
+            strip.elements.append(os.path.basename(frame_path))
+    else:
+        strip.use_sequence = True
+
+
+def _compositor_refresh_is_noop(scene_name, input_dir, blend_filename):
+    """True when refreshing the comp scene would tear down and rebuild nothing.
+
+    Covers the steady state where no frames exist and the comp scene was
+    already cleared (no frame signature recorded): skipping avoids a strip
+    rebuild and the depsgraph flush that comes with it. The populated-frames
+    fast path is handled by the signature check inside setup_compositor.
+    """
+    comp_scene = bpy.data.scenes.get(scene_name + "_Comp")
+    if comp_scene is None:
+        return False
+    if _frames_exist(input_dir, blend_filename):
+        return False
+    return comp_scene.get("mce_frame_signature") is None
+
+
+def setup_compositor(scene_name, input_dir, output_dir, is_mobile=True, report=None,
+                     frame_paths=None):
+    """Set up VSE for compositing frames to video.
+
+    A free function so other operators can call it directly without
+    instantiating the setup operator; pass their own report for messages.
+    """
+    if report is None:
+        report = lambda level, msg: print(msg)
+    # Get the current blend file name without extension (memoized per path)
+    blend_filepath = bpy.data.filepath
+    if not blend_filepath:
+        report({'ERROR'}, "Please save your file first")
+        return False
+
+    blend_filename = _resolve_paths(blend_filepath).blend_filename
+    
+    # Debug: print paths
+    abs_input_dir = bpy.path.abspath(input_dir)
+    abs_output_dir = bpy.path.abspath(output_dir)
+    report({'INFO'}, f"DEBUGGING: Setting up compositor for {scene_name}")
+    report({'INFO'}, f"DEBUGGING: Input dir: {abs_input_dir}")
+    report({'INFO'}, f"DEBUGGING: Output dir: {abs_output_dir}")
+    
+    # Create output directory if it doesn't exist
+    _ensure_dir(abs_output_dir)
+    
+    # Create a new scene for compositing
+    comp_scene_name = scene_name + "_Comp"
+    if comp_scene_name in bpy.data.scenes:
+        comp_scene = bpy.data.scenes[comp_scene_name]
+        report({'INFO'}, f"DEBUGGING: Using existing compositor scene: {comp_scene_name}")
+    else:
+        comp_scene = bpy.data.scenes.new(comp_scene_name)
+        report({'INFO'}, f"DEBUGGING: Created new compositor scene: {comp_scene_name}")
+    
+    # Setup the scene for video output
+    if scene_name in bpy.data.scenes:
+        # Copy frame rate and range from source scene
+        source_scene = bpy.data.scenes[scene_name]
+        comp_scene.render.fps = source_scene.render.fps
+        comp_scene.frame_start = source_scene.frame_start
+        comp_scene.frame_end = source_scene.frame_end
+        report({'INFO'}, f"DEBUGGING: Copied settings from {scene_name}: FPS={source_scene.render.fps}, Frame range={source_scene.frame_start}-{source_scene.frame_end}")
+    else:
+        # Default values if source scene doesn't exist
+        comp_scene.render.fps = 30
+        comp_scene.frame_start = 1
+        comp_scene.frame_end = 250
+        report({'INFO'}, f"DEBUGGING: Using default settings: FPS=30, Frame range=1-250")
+    
+    # Set the output path for the video (relative to blend file)
+    # NOTE: Make sure to add the file extension for the output video
+    output_path = output_dir + blend_filename + ".mp4"
+    comp_scene.render.filepath = output_path
+    report({'INFO'}, f"DEBUGGING: Output path set to: {output_path}")
+    
+    # Set output to FFMPEG video with MPEG-4
+    comp_scene.render.image_settings.file_format = 'FFMPEG'
+    comp_scene.render.ffmpeg.format = 'MPEG4'
+    comp_scene.render.ffmpeg.codec = 'H264'
+    
+    # Set encoding settings
+    comp_scene.render.ffmpeg.constant_rate_factor = 'MEDIUM'  # CRF ~23
+    comp_scene.render.ffmpeg.audio_codec = 'AAC'
+    comp_scene.render.ffmpeg.gopsize = comp_scene.render.fps * 2  # 2s keyframe interval
+    comp_scene.render.ffmpeg.use_max_b_frames = True
+    comp_scene.render.ffmpeg.max_b_frames = 2
+    comp_scene.render.ffmpeg.video_bitrate = 6000  # Bitrate in kb/s
+    comp_scene.render.ffmpeg.maxrate = 9000
+    comp_scene.render.ffmpeg.minrate = 0
+    # Rate-control buffer of 2x maxrate; the old 1800 kbit buffer forced
+    # the encoder to flush on nearly every HD frame
+    comp_scene.render.ffmpeg.buffersize = 18000
+    
+    # Set up the VSE
+    if not comp_scene.sequence_editor:
+        comp_scene.sequence_editor_create()
+        report({'INFO'}, "DEBUGGING: Created new sequence editor")
+    
+    # Add image sequence, pre-sorted numerically so no re-sort is needed here
+    strips = comp_scene.sequence_editor.sequences
+    if frame_paths is None:
+        frame_paths = _sorted_frame_files(input_dir, blend_filename)
+    frames = frame_paths
+
+    # Print debug info
+    report({'INFO'}, f"DEBUGGING: Looking for frames in: {abs_input_dir}")
+    report({'INFO'}, f"DEBUGGING: Found {len(frames)} frames")
+    
+    if frames:
+        # Find the first frame
+        first_frame = frames[0]
+        last_frame = frames[-1]
+        num_frames = len(frames)
+        
+        report({'INFO'}, f"DEBUGGING: First frame: {first_frame}")
+        report({'INFO'}, f"DEBUGGING: Last frame: {last_frame}")
+        
+        # Calculate new scene end frame for looping if enabled
+        settings = bpy.context.scene.mce
+        loop_extend_frames = settings.loop_extend_frames
+        hold_frames = settings.hold_frames
+
+        # Skip the strip teardown/rebuild when the frame set and loop
+        # settings match what this comp scene was last built from —
+        # node/strip mutations trigger a full depsgraph invalidation
+        signature = (f"{num_frames}:{os.path.getmtime(first_frame)}:"
+                     f"{os.path.getmtime(last_frame)}:{loop_extend_frames}:{hold_frames}")
+        if comp_scene.get("mce_frame_signature") == signature and len(strips) > 0:
+            report({'INFO'}, f"DEBUGGING: Frame set unchanged, keeping existing strips in {comp_scene_name}")
+            return True
+
+        # When the layout is a single forward strip, update it in place:
+        # new_image probes the first frame on disk and allocates fresh image
+        # datablocks every call, and repeated rebuilds leak the old ones
+        forward_strip = strips.get(f"{scene_name}_Forward")
+        if forward_strip is not None and not loop_extend_frames and len(strips) == 1:
+            # Image strips locate frames via directory + elements
+            # (filepath is a movie-strip attribute)
+            forward_strip.directory = os.path.dirname(first_frame)
+            forward_strip.frame_start = 1
+            _assign_strip_elements(forward_strip, frames)
+            forward_strip.frame_final_duration = num_frames
+            comp_scene["mce_frame_signature"] = signature
+            report({'INFO'}, f"DEBUGGING: Updated existing forward strip in place ({num_frames} frames)")
+            return True
+
+        # Clear existing strips
+        for strip in list(strips):
+            strips.remove(strip)
+        report({'INFO'}, "DEBUGGING: Cleared existing sequence strips")
+
+        if loop_extend_frames:
+            # Forward + hold + reverse + hold
+            new_end_frame = (num_frames * 2) + (hold_frames * 2)
+            comp_scene.frame_end = new_end_frame
+            report({'INFO'}, f"DEBUGGING: Loop enabled, new end frame: {new_end_frame}")
+        
+        # Create the forward image strip
+        try:
+            forward_strip = strips.new_image(
+                name=f"{scene_name}_Forward",
+                filepath=first_frame,
+                channel=1,
+                frame_start=1
+            )
+
+            # Set the image strip to use the sequence
+            _assign_strip_elements(forward_strip, frames)
+            forward_strip.frame_final_duration = num_frames
+            
+            report({'INFO'}, f"DEBUGGING: Created forward strip with {num_frames} frames")
+            
+            # If looping is enabled, extend the same sequences instead of
+            # creating dedicated hold strips: each extra new_image call
+            # probes its file on disk and adds a strip to every collection
+            # walk, and the still-frame tail gives the hold for free
+            if loop_extend_frames and num_frames > 1:
+                # 1. Hold the last frame via the forward strip's still tail
+                forward_strip.frame_still_end = hold_frames
+
+                # 2. One reversed copy of the same sequence covers the
+                #    backward pass; its still tail holds the first frame
+                reverse_strip = strips.new_image(
+                    name=f"{scene_name}_Reverse",
+                    filepath=first_frame,
+                    channel=1,
+                    frame_start=num_frames + hold_frames + 1
+                )
+                _assign_strip_elements(reverse_strip, frames)
+                reverse_strip.use_reverse_frames = True
+                reverse_strip.frame_final_duration = num_frames
+                reverse_strip.frame_still_end = hold_frames
+
+                report({'INFO'}, "DEBUGGING: Created loop animation strips (forward + reversed, still-frame holds)")
+        except Exception as e:
+            report({'ERROR'}, f"DEBUGGING: Error creating strips: {str(e)}")
+            return False
+        
+        report({'INFO'}, f"Added {num_frames} frames to {comp_scene_name}")
+
+        # Remember what this comp scene was built from
+        comp_scene["mce_frame_signature"] = signature
+
+        return True
+    else:
+        report({'WARNING'}, f"No frames found in {abs_input_dir}. You'll need to render before compositing.")
+
+        # Clear existing strips and any stale signature
+        for strip in list(strips):
+            strips.remove(strip)
+        comp_scene.pop("mce_frame_signature", None)
+
+        # Create a text strip with warning message
+        try:
+            text_strip = strips.new_effect(
+                name="Warning",
+                type='TEXT',
+                channel=1,
+                frame_start=1,
+                frame_end=comp_scene.frame_end
+            )
+            
+            # Set the text directly as a string
+            if hasattr(text_strip, "text"):
+                text_strip.text = "No frames found - render the scene first"
+                # Set text properties for better visibility
+                if hasattr(text_strip, "font_size"):
+                    text_strip.font_size = 48
+                if hasattr(text_strip, "color"):
+                    text_strip.color = (1.0, 0.3, 0.3, 1.0)  # Red text
+            
+            report({'INFO'}, "DEBUGGING: Created warning text strip")
+        except Exception as e:
+            report({'ERROR'}, f"DEBUGGING: Error creating text strip: {str(e)}")
+        
+        return False
+
+
 class MultiChannelExportPipelineSetup(Operator):
     """Setup the multi-channel export pipeline"""
     bl_idname = "export.setup_pipeline"
@@ -37,247 +323,64 @@ class MultiChannelExportPipelineSetup(Operator):
         max=120,
     )
     
-    def setup_compositor(self, scene_name, input_dir, output_dir, is_mobile=True):
-        """Set up VSE for compositing frames to video - can be called from other operators"""
-        # Get the current blend file name without extension
-        blend_filepath = bpy.data.filepath
-        if not blend_filepath:
-            self.report({'ERROR'}, "Please save your file first")
-            return False
-            
-        blend_filename = os.path.splitext(os.path.basename(blend_filepath))[0]
-        
-        # Debug: print paths
-        abs_input_dir = bpy.path.abspath(input_dir)
-        abs_output_dir = bpy.path.abspath(output_dir)
-        self.report({'INFO'}, f"DEBUGGING: Setting up compositor for {scene_name}")
-        self.report({'INFO'}, f"DEBUGGING: Input dir: {abs_input_dir}")
-        self.report({'INFO'}, f"DEBUGGING: Output dir: {abs_output_dir}")
-        
-        # Create output directory if it doesn't exist
-        if not os.path.exists(abs_output_dir):
-            os.makedirs(abs_output_dir)
-            self.report({'INFO'}, f"DEBUGGING: Created output directory: {abs_output_dir}")
-        
-        # Create a new scene for compositing
-        comp_scene_name = scene_name + "_Comp"
-        if comp_scene_name in bpy.data.scenes:
-            comp_scene = bpy.data.scenes[comp_scene_name]
-            self.report({'INFO'}, f"DEBUGGING: Using existing compositor scene: {comp_scene_name}")
-        else:
-            comp_scene = bpy.data.scenes.new(comp_scene_name)
-            self.report({'INFO'}, f"DEBUGGING: Created new compositor scene: {comp_scene_name}")
-        
-        # Setup the scene for video output
-        if scene_name in bpy.data.scenes:
-            # Copy frame rate and range from source scene
-            source_scene = bpy.data.scenes[scene_name]
-            comp_scene.render.fps = source_scene.render.fps
-            comp_scene.frame_start = source_scene.frame_start
-            comp_scene.frame_end = source_scene.frame_end
-            self.report({'INFO'}, f"DEBUGGING: Copied settings from {scene_name}: FPS={source_scene.render.fps}, Frame range={source_scene.frame_start}-{source_scene.frame_end}")
-        else:
-            # Default values if source scene doesn't exist
-            comp_scene.render.fps = 30
-            comp_scene.frame_start = 1
-            comp_scene.frame_end = 250
-            self.report({'INFO'}, f"DEBUGGING: Using default settings: FPS=30, Frame range=1-250")
-        
-        # Set the output path for the video (relative to blend file)
-        # NOTE: Make sure to add the file extension for the output video
-        output_path = output_dir + blend_filename + ".mp4"
-        comp_scene.render.filepath = output_path
-        self.report({'INFO'}, f"DEBUGGING: Output path set to: {output_path}")
-        
-        # Set output to FFMPEG video with MPEG-4
-        comp_scene.render.image_settings.file_format = 'FFMPEG'
-        comp_scene.render.ffmpeg.format = 'MPEG4'
-        comp_scene.render.ffmpeg.codec = 'H264'
-        
-        # Set encoding settings
-        comp_scene.render.ffmpeg.constant_rate_factor = 'MEDIUM'
-        comp_scene.render.ffmpeg.audio_codec = 'AAC'
-        comp_scene.render.ffmpeg.gopsize = 18  # Keyframe interval
-        comp_scene.render.ffmpeg.video_bitrate = 6000  # Bitrate in kb/s
-        comp_scene.render.ffmpeg.maxrate = 9000
-        comp_scene.render.ffmpeg.minrate = 0
-        comp_scene.render.ffmpeg.buffersize = 1800
-        
-        # Set up the VSE
-        if not comp_scene.sequence_editor:
-            comp_scene.sequence_editor_create()
-            self.report({'INFO'}, "DEBUGGING: Created new sequence editor")
-        
-        # Clear existing strips
-        for strip in comp_scene.sequence_editor.sequences:
-            comp_scene.sequence_editor.sequences.remove(strip)
-        self.report({'INFO'}, "DEBUGGING: Cleared existing sequence strips")
-        
-        # Add image sequence
-        frame_path = input_dir + blend_filename + "_"
-        strips = comp_scene.sequence_editor.sequences
-        
-        # Get the full path to check for existing frames
-        frame_pattern = bpy.path.abspath(frame_path + "*.*")
-        frames = glob.glob(frame_pattern)
-        
-        # Print debug info
-        self.report({'INFO'}, f"DEBUGGING: Looking for frames at: {frame_pattern}")
-        self.report({'INFO'}, f"DEBUGGING: Found {len(frames)} frames")
-        
-        if frames:
-            # Sort the frames to ensure correct order
-            frames.sort()
-            # Find the first frame
-            first_frame = frames[0]
-            last_frame = frames[-1]
-            num_frames = len(frames)
-            
-            self.report({'INFO'}, f"DEBUGGING: First frame: {first_frame}")
-            self.report({'INFO'}, f"DEBUGGING: Last frame: {last_frame}")
-            
-            # Calculate new scene end frame for looping if enabled
-            loop_extend_frames = bpy.context.scene.loop_extend_frames
-            hold_frames = bpy.context.scene.hold_frames
-            
-            if loop_extend_frames:
-                # Forward + hold + reverse + hold
-                new_end_frame = (num_frames * 2) + (hold_frames * 2)
-                comp_scene.frame_end = new_end_frame
-                self.report({'INFO'}, f"DEBUGGING: Loop enabled, new end frame: {new_end_frame}")
-            
-            # Create the forward image strip
-            try:
-                forward_strip = strips.new_image(
-                    name=f"{scene_name}_Forward",
-                    filepath=first_frame,
-                    channel=1,
-                    frame_start=1
-                )
-                
-                # Set the image strip to use the sequence
-                forward_strip.use_sequence = True
-                forward_strip.frame_final_duration = num_frames
-                
-                self.report({'INFO'}, f"DEBUGGING: Created forward strip with {num_frames} frames")
-                
-                # If looping is enabled, create the additional parts of the loop
-                if loop_extend_frames and num_frames > 1:
-                    # 1. Hold the last frame
-                    last_frame_strip = strips.new_image(
-                        name=f"{scene_name}_HoldLast",
-                        filepath=last_frame,
-                        channel=1,
-                        frame_start=num_frames + 1
-                    )
-                    last_frame_strip.frame_final_duration = hold_frames
-                    
-                    # 2. Add reversed sequence
-                    reverse_strip = strips.new_image(
-                        name=f"{scene_name}_Reverse",
-                        filepath=last_frame,  # Start with last frame
-                        channel=1,
-                        frame_start=num_frames + hold_frames + 1
-                    )
-                    reverse_strip.frame_final_duration = num_frames
-                    
-                    # Now create the reverse sequence
-                    if hasattr(reverse_strip, "elements"):
-                        # Clear existing elements
-                        while len(reverse_strip.elements) > 0:
-                            reverse_strip.elements.pop()
-                        
-                        # Add frames in reverse order
-                        for i, frame_path in enumerate(reversed(frames)):
-                            element = reverse_strip.elements.append(frame_path)
-                    
-                    # 3. Hold the first frame
-                    first_frame_strip = strips.new_image(
-                        name=f"{scene_name}_HoldFirst",
-                        filepath=first_frame,
-                        channel=1,
-                        frame_start=num_frames * 2 + hold_frames + 1
-                    )
-                    first_frame_strip.frame_final_duration = hold_frames
-                    
-                    self.report({'INFO'}, "DEBUGGING: Created loop animation strips")
-            except Exception as e:
-                self.report({'ERROR'}, f"DEBUGGING: Error creating strips: {str(e)}")
-                return False
-            
-            self.report({'INFO'}, f"Added {num_frames} frames to {comp_scene_name}")
-            
-            # Force an update to ensure the VSE recognizes the changes
-            bpy.context.view_layer.update()
-            
-            return True
-        else:
-            self.report({'WARNING'}, f"No frames found at {frame_pattern}. You'll need to render before compositing.")
-            
-            # Create a text strip with warning message
-            try:
-                text_strip = strips.new_effect(
-                    name="Warning",
-                    type='TEXT',
-                    channel=1,
-                    frame_start=1,
-                    frame_end=comp_scene.frame_end
-                )
-                
-                # Set the text directly as a string
-                if hasattr(text_strip, "text"):
-                    text_strip.text = "No frames found - render the scene first"
-                    # Set text properties for better visibility
-                    if hasattr(text_strip, "font_size"):
-                        text_strip.font_size = 48
-                    if hasattr(text_strip, "color"):
-                        text_strip.color = (1.0, 0.3, 0.3, 1.0)  # Red text
-                
-                self.report({'INFO'}, "DEBUGGING: Created warning text strip")
-            except Exception as e:
-                self.report({'ERROR'}, f"DEBUGGING: Error creating text strip: {str(e)}")
-            
-            return False
-    
     def execute(self, context):
         # Get the current blend file name without extension
         blend_filepath = bpy.data.filepath
         if not blend_filepath:
             self.report({'ERROR'}, "Please save your file first")
             return {'CANCELLED'}
-            
-        blend_filename = os.path.splitext(os.path.basename(blend_filepath))[0]
+
+        blend_filename = _resolve_paths(blend_filepath).blend_filename
         
         # Store the loop settings in the scene properties for later reference
-        context.scene.loop_extend_frames = self.loop_extend_frames
-        context.scene.hold_frames = self.hold_frames
+        context.scene.mce.loop_extend_frames = self.loop_extend_frames
+        context.scene.mce.hold_frames = self.hold_frames
         
+        # Build each derived path once up front; these are Blender-relative
+        # ('//') paths, so they keep forward slashes rather than os.path.join
+        base_dir = self.base_output_dir
+        mobile_frames_dir = base_dir + "MobileFrames/"
+        mobile_out_dir = base_dir + "MobileOut/"
+        desktop_frames_dir = base_dir + "DesktopFrames/"
+        desktop_out_dir = base_dir + "DesktopOut/"
+
         # Create the directory structure if it doesn't exist
         directories = [
-            self.base_output_dir + "MobileFrames/",
-            self.base_output_dir + "MobileOut/",
-            self.base_output_dir + "DesktopFrames/",
-            self.base_output_dir + "DesktopOut/"
+            mobile_frames_dir,
+            mobile_out_dir,
+            desktop_frames_dir,
+            desktop_out_dir
         ]
-        
+
         for dir_path in directories:
-            abs_path = bpy.path.abspath(dir_path)
-            if not os.path.exists(abs_path):
-                os.makedirs(abs_path)
-                self.report({'INFO'}, f"Created directory: {abs_path}")
+            _ensure_dir(bpy.path.abspath(dir_path))
         
+        # Optional RAM-backed scratch directory for intermediate frames.
+        # The comp scenes must scan wherever the renders actually land, so
+        # the override applies to the render output and the compositor
+        # input alike (mirroring _frames_dir_for on the encode side).
+        staging_dir = context.scene.mce.frame_staging_dir
+        if staging_dir:
+            mobile_input_dir = os.path.join(staging_dir, "MobileFrames") + os.sep
+            desktop_input_dir = os.path.join(staging_dir, "DesktopFrames") + os.sep
+        else:
+            mobile_input_dir = mobile_frames_dir
+            desktop_input_dir = desktop_frames_dir
+
         # Function to set up rendering settings for a scene
         def setup_scene_rendering(scene, is_mobile=True):
-            # Set the output path for frames (relative to blend file)
-            if is_mobile:
-                scene.render.filepath = self.base_output_dir + "MobileFrames/" + blend_filename + "_"
-            else:
-                scene.render.filepath = self.base_output_dir + "DesktopFrames/" + blend_filename + "_"
+            # Set the output path for frames (relative to blend file, or the
+            # staging directory when one is configured)
+            frames_dir = mobile_input_dir if is_mobile else desktop_input_dir
+            scene.render.filepath = frames_dir + blend_filename + "_"
             
             # Set frame naming format
             scene.render.use_file_extension = True
             scene.render.use_overwrite = True
-            scene.render.use_placeholder = True
+            # Placeholders exist to coordinate multiple workers rendering the
+            # same scene; ours each own a scene, so skip the extra
+            # stat-and-touch per frame
+            scene.render.use_placeholder = False
             
             # Only modify render settings if we're not using existing scene settings
             if not self.use_scene_settings:
@@ -296,12 +399,16 @@ class MultiChannelExportPipelineSetup(Operator):
             self.report({'INFO'}, f"Using existing scene: {mobile_scene_name}")
         
         setup_scene_rendering(mobile_scene, is_mobile=True)
-        self.setup_compositor(
-            mobile_scene_name,
-            self.base_output_dir + "MobileFrames/",
-            self.base_output_dir + "MobileOut/",
-            is_mobile=True
-        )
+        if _compositor_refresh_is_noop(mobile_scene_name, mobile_input_dir, blend_filename):
+            self.report({'INFO'}, f"DEBUGGING: No frames and {mobile_scene_name}_Comp already clean, skipping refresh")
+        else:
+            setup_compositor(
+                mobile_scene_name,
+                mobile_input_dir,
+                mobile_out_dir,
+                is_mobile=True,
+                report=self.report
+            )
         
         # Setup workflow for desktop version
         desktop_scene_name = "DesktopScene"
@@ -313,12 +420,16 @@ class MultiChannelExportPipelineSetup(Operator):
             self.report({'INFO'}, f"Using existing scene: {desktop_scene_name}")
         
         setup_scene_rendering(desktop_scene, is_mobile=False)
-        self.setup_compositor(
-            desktop_scene_name,
-            self.base_output_dir + "DesktopFrames/",
-            self.base_output_dir + "DesktopOut/",
-            is_mobile=False
-        )
+        if _compositor_refresh_is_noop(desktop_scene_name, desktop_input_dir, blend_filename):
+            self.report({'INFO'}, f"DEBUGGING: No frames and {desktop_scene_name}_Comp already clean, skipping refresh")
+        else:
+            setup_compositor(
+                desktop_scene_name,
+                desktop_input_dir,
+                desktop_out_dir,
+                is_mobile=False,
+                report=self.report
+            )
         
         # Create or update the Control scene
         control_scene_name = "ControlScene"
@@ -329,8 +440,10 @@ class MultiChannelExportPipelineSetup(Operator):
             control_scene = bpy.data.scenes[control_scene_name]
             self.report({'INFO'}, f"Using existing scene: {control_scene_name}")
         
-        # Set the control scene as the active scene
-        context.window.scene = bpy.data.scenes[control_scene_name]
+        # Set the control scene as the active scene; skip the assignment when
+        # it already is, since even a no-op switch fires a scene-change event
+        if context.window.scene is not control_scene:
+            context.window.scene = control_scene
         
         self.report({'INFO'}, "Pipeline setup complete!")
         return {'FINISHED'}
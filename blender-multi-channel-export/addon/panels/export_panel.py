@@ -16,7 +16,7 @@ class MultiChannelExportPanel(Panel):
         # Display version number at the top
         row = layout.row()
         box = row.box()
-        box.label(text=f"Version: {context.scene.mce_addon_version}", icon='PLUGIN')
+        box.label(text=f"Version: {context.scene.mce.addon_version}", icon='PLUGIN')
         
         # Setup pipeline section
         box = layout.box()
@@ -47,20 +47,22 @@ class MultiChannelExportPanel(Panel):
         # Get the control scene for looping settings
         control_scene = bpy.data.scenes.get("ControlScene", context.scene)
         
+        settings = control_scene.mce
+
         row = box.row()
-        row.prop(control_scene, "loop_extend_frames", text="Create Loop Animation")
-        
+        row.prop(settings, "loop_extend_frames", text="Create Loop Animation")
+
         # Only enable hold frames control if looping is enabled
         sub = box.row()
-        sub.enabled = control_scene.loop_extend_frames
-        sub.prop(control_scene, "hold_frames", text="Hold Frames")
-        
+        sub.enabled = settings.loop_extend_frames
+        sub.prop(settings, "hold_frames", text="Hold Frames")
+
         # Add description of the looping process
-        if control_scene.loop_extend_frames:
+        if settings.loop_extend_frames:
             info_box = box.box()
             info_box.label(text="Loop sequence:")
             col = info_box.column(align=True)
             col.label(text="1. Play animation forward")
-            col.label(text=f"2. Hold last frame for {control_scene.hold_frames} frames")
+            col.label(text=f"2. Hold last frame for {settings.hold_frames} frames")
             col.label(text="3. Play animation backward")
-            col.label(text=f"4. Hold first frame for {control_scene.hold_frames} frames")
\ No newline at end of file
+            col.label(text=f"4. Hold first frame for {settings.hold_frames} frames")
\ No newline at end of file